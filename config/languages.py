@@ -1,5 +1,6 @@
 # FilePath: config/languages.py
 
+from functools import lru_cache
 from typing import Dict, Set
 from pathlib import Path
 
@@ -364,8 +365,13 @@ class LanguageConfig:
     @classmethod
     def get_syntax_highlighting(cls, file_path: Path) -> str:
         """Get appropriate syntax highlighting for code blocks."""
-        name = file_path.name.lower()
-        suffix = file_path.suffix.lower()
+        return cls._syntax_for_name(file_path.name.lower())
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _syntax_for_name(cls, name: str) -> str:
+        """Resolve syntax highlighting for a lowercase file name (memoized)."""
+        suffix = Path(name).suffix
 
         # Check specific filenames first
         if name in cls.SYNTAX_HIGHLIGHTING:
@@ -377,8 +383,13 @@ class LanguageConfig:
     @classmethod
     def get_file_type_description(cls, file_path: Path) -> str:
         """Get descriptive file type for better analysis context."""
-        name = file_path.name.lower()
-        suffix = file_path.suffix.lower()
+        return cls._description_for_name(file_path.name.lower())
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _description_for_name(cls, name: str) -> str:
+        """Resolve the file type description for a lowercase file name (memoized)."""
+        suffix = Path(name).suffix
 
         # Check specific filenames first
         if name in cls.FILE_TYPE_DESCRIPTIONS:
@@ -1,5 +1,6 @@
 # FilePath: config/settings.py
 
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any
@@ -8,6 +9,15 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Directory holding config/ and the default output directory
+_PROJECT_DIR = Path(__file__).parent.parent
+
+
+@functools.lru_cache(maxsize=64)
+def _output_dir(output_dir: str, repo_name: str) -> Path:
+    """Build a repository's output directory path (cached per name)."""
+    return _PROJECT_DIR / output_dir / repo_name
+
 
 class Settings:
     """Global configuration settings for repo analyzer."""
@@ -17,9 +27,13 @@ class Settings:
     FILES_PER_CHUNK: int = 8
     USE_ENTIRE_FILES: bool = True
     USE_SMART_COMPRESSION: bool = True
+    # Files smaller than either threshold are left uncompressed
+    SMART_COMPRESSION_MIN_BYTES: int = 2048
+    SMART_COMPRESSION_MIN_LINES: int = 50
     MAX_FILE_SIZE: int = 15000
     MAX_INDENTATION_LEVEL: int = 3
     INDENTATION_SPACES: int = 4
+    INCLUDE_CHUNK_CONTEXT: bool = True
 
     # LLM Configuration
     DEFAULT_LLM: str = "claude"
@@ -39,6 +53,9 @@ class Settings:
     # Git Configuration
     CLONE_TIMEOUT: int = 300  # 5 minutes
     GIT_COMMAND_TIMEOUT: int = 30
+    # Clone remote repositories with only their latest commit: faster, but the
+    # report then lacks the commit count and the other branches
+    SHALLOW_CLONE: bool = False
 
     # Processing Configuration
     PROCESSING_DELAY: float = 2.0
@@ -47,8 +64,8 @@ class Settings:
     @classmethod
     def get_output_dir(cls, repo_name: str) -> Path:
         """Get output directory for a specific repository."""
-        script_dir = Path(__file__).parent.parent
-        return script_dir / cls.OUTPUT_DIR / repo_name
+        # OUTPUT_DIR is part of the cache key since the CLI can change it
+        return _output_dir(cls.OUTPUT_DIR, repo_name)
 
     @classmethod
     def update_from_dict(cls, config_dict: Dict[str, Any]) -> None:
@@ -9,7 +9,7 @@ from config.rate_limits import rate_limit_manager
 from ..llm.factory import LLMFactory
 from ..utils.logging_utils import get_logger
 from .git_handler import GitHandler
-from .file_processor import FileProcessor
+from .file_processor import FileProcessor, SourceFile
 from .env_extractor import EnvExtractor
 from .conversation_analyzer import ConversationAnalyzer
 from .developer_explanation import DeveloperExplanation
@@ -78,13 +78,18 @@ class RepositoryAnalyzer:
             self.logger.info("Extracting Git information...")
             git_info = self.git_handler.extract_git_info(local_repo_path)
 
+            # Scan the repository once for source and environment files
+            self.logger.info("Scanning repository files...")
+            all_files, env_files = self.file_processor.scan_all(local_repo_path)
+
             # Extract environment configurations
             self.logger.info("Extracting environment configurations...")
-            env_configs = self.env_extractor.extract_env_config(local_repo_path)
+            env_configs = self.env_extractor.extract_env_config(
+                local_repo_path, env_files=env_files
+            )
 
             # Process source files
             self.logger.info("Processing source files...")
-            all_files = self.file_processor.get_all_source_files(local_repo_path)
             prioritized_files = self.file_processor.prioritize_files(all_files)
 
             self.logger.info(f"Found {len(all_files)} source files")
@@ -204,16 +209,19 @@ class RepositoryAnalyzer:
         # Check if it's a remote URL
         if self._is_remote_url(repo_path):
             self.logger.info(f"Cloning remote repository: {repo_path}")
-            local_path = self.git_handler.clone_repository(repo_path)
+            # Clone with the requested branch checked out
+            local_path = self.git_handler.clone_repository(
+                repo_path, branch=branch, shallow=Settings.SHALLOW_CLONE
+            )
         else:
             local_path = Path(repo_path)
             if not local_path.exists():
                 raise ValueError(f"Repository path does not exist: {repo_path}")
 
-        # Checkout specific branch if requested
-        if branch:
-            self.logger.info(f"Checking out branch: {branch}")
-            self.git_handler.checkout_branch(local_path, branch)
+            # Checkout specific branch if requested
+            if branch:
+                self.logger.info(f"Checking out branch: {branch}")
+                self.git_handler.checkout_branch(local_path, branch)
 
         return local_path
 
@@ -229,7 +237,7 @@ class RepositoryAnalyzer:
     def _perform_analysis_audit(
         self,
         repo_path: Path,
-        prioritized_files: List[Path],
+        prioritized_files: List[SourceFile],
         env_configs: Dict,
         git_info: Dict,
         human_context: str,
@@ -253,7 +261,7 @@ class RepositoryAnalyzer:
     def _perform_developer_explanation(
         self,
         repo_path: Path,
-        prioritized_files: List[Path],
+        prioritized_files: List[SourceFile],
         env_configs: Dict,
         git_info: Dict,
         human_context: str,
@@ -279,7 +287,10 @@ class RepositoryAnalyzer:
         )
 
     def _get_code_analysis(
-        self, repo_path: Path, prioritized_files: List[Path], human_context: str
+        self,
+        repo_path: Path,
+        prioritized_files: List[SourceFile],
+        human_context: str,
     ) -> List[str]:
         """Get code analysis from chunks (shared by both modes)."""
 
@@ -315,8 +326,7 @@ class RepositoryAnalyzer:
                 chunk_content, i, len(file_chunks), human_context
             )
 
-            ReportGenerator.save_progress_log(
-                self,
+            self.report_generator.save_progress_log(
                 content=f"CHUNK ANALYSIS CONTENT: {chunk_analysis}",
                 repo_name=repo_path.name,
                 timestamp=self.timestamp,
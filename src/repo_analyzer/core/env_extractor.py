@@ -1,125 +1,159 @@
 # FilePath: src/repo_analyzer/core/env_extractor.py
 
+import functools
+import io
+import re
 from pathlib import Path
-from typing import Dict
+from typing import Dict, FrozenSet, List, Optional, Set, TextIO, Tuple
 
+from ..utils.file_utils import read_text_file, relative_path, root_prefix
 from ..utils.logging_utils import get_logger
 
+# One line of an env file: a "# comment" or a "KEY=value" pair. Surrounding
+# whitespace is excluded from the captured groups.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:(#.*?)|([^=\n]*?)[^\S\n]*=[^\S\n]*(.*?))[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Substrings marking a variable name as holding a secret
+_SENSITIVE_RE = re.compile(
+    r"password|secret|key|token|auth|credential|"
+    r"private|jwt|oauth|api_key|access_key"
+)
+
+# Fallback descriptions by name fragment, checked in order
+_DESCRIPTION_PATTERNS: List[Tuple["re.Pattern[str]", str]] = [
+    (re.compile(r"url|uri"), "Service connection URL/URI"),
+    (re.compile(r"key|secret|token"), "Authentication/encryption key"),
+    (re.compile(r"host|server"), "Server/service host address"),
+    (re.compile(r"port"), "Service port number"),
+    (re.compile(r"password|pass"), "Authentication password"),
+    (re.compile(r"user|username"), "Authentication username"),
+    (re.compile(r"email|mail"), "Email configuration"),
+    (re.compile(r"timeout"), "Timeout configuration (seconds)"),
+    (re.compile(r"max|limit"), "Limit/threshold configuration"),
+    (re.compile(r"enable|disable"), "Feature toggle flag"),
+]
+
 
 class EnvExtractor:
     """Handles extraction and analysis of environment configuration files."""
 
+    # Directory names whose environment files are skipped
+    _IGNORE_DIRS: FrozenSet[str] = frozenset(
+        {
+            "node_modules",
+            "__pycache__",
+            ".git",
+            "target",
+            "dist",
+            "build",
+            "vendor",
+            ".cargo",
+            "bin",
+            "obj",
+            "out",
+            "debug",
+            "release",
+            "temp",
+            "tmp",
+            ".tmp",
+            "cache",
+            ".cache",
+        }
+    )
+
+    # Comprehensive .env file patterns (all literal file names)
+    ENV_FILE_PATTERNS: Tuple[str, ...] = (
+        ".env",
+        ".env.example",
+        ".env.sample",
+        ".env.template",
+        ".env.local",
+        ".env.local.example",
+        ".env.development",
+        ".env.dev",
+        ".env.staging",
+        ".env.stage",
+        ".env.production",
+        ".env.prod",
+        ".env.test",
+        ".env.testing",
+        ".environment",
+        "env.example",
+        "env.sample",
+        "env.template",
+    )
+    _ENV_FILE_NAMES: FrozenSet[str] = frozenset(ENV_FILE_PATTERNS)
+
     def __init__(self):
         self.logger = get_logger(__name__)
 
-    def extract_env_config(self, repo_path: Path) -> Dict:
+    def extract_env_config(
+        self, repo_path: Path, env_files: Optional[List[Path]] = None
+    ) -> Dict:
         """
         Extract and analyze ALL .env configuration files comprehensively.
 
         Args:
             repo_path: Path to the repository
+            env_files: Environment files already found by a repository scan
+                (e.g. FileProcessor.scan_all); searched for if not given
 
         Returns:
             Dictionary containing environment configurations
         """
         env_configs = {}
 
-        # Comprehensive .env file patterns
-        env_patterns = [
-            ".env",
-            ".env.example",
-            ".env.sample",
-            ".env.template",
-            ".env.local",
-            ".env.local.example",
-            ".env.development",
-            ".env.dev",
-            ".env.staging",
-            ".env.stage",
-            ".env.production",
-            ".env.prod",
-            ".env.test",
-            ".env.testing",
-            ".environment",
-            "env.example",
-            "env.sample",
-            "env.template",
-        ]
-
-        self.logger.info("Scanning for environment configuration files...")
-        found_env_files = []
-
-        for pattern in env_patterns:
-            # Search in root directory
-            env_file = repo_path / pattern
-            if env_file.exists() and env_file.is_file():
-                found_env_files.append(env_file)
-
-            # Search recursively in subdirectories (but avoid common ignore dirs)
-            for env_file in repo_path.rglob(pattern):
-                if not self._should_ignore_file(env_file) and env_file.is_file():
-                    found_env_files.append(env_file)
-
-        # Remove duplicates
-        found_env_files = list(set(found_env_files))
+        # Sorted either way, so files are reported in a deterministic order
+        if env_files is None:
+            found_env_files = sorted(self._find_env_files(repo_path))
+        else:
+            found_env_files = sorted(env_files)
 
+        prefix = root_prefix(repo_path)
         for env_file in found_env_files:
             try:
-                with open(env_file, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = read_text_file(env_file)
 
                 # Parse environment variables with enhanced parsing
                 env_vars = {}
                 comments = []
 
-                for line_num, line in enumerate(content.split("\n"), 1):
-                    original_line = line
-                    line = line.strip()
+                line_num = 1
+                last_pos = 0
+                for match in _ENV_LINE_RE.finditer(content):
+                    comment, key, value = match.groups()
 
                     # Capture comments for context
-                    if line.startswith("#") and line not in ["#", "# "]:
-                        comments.append(f"Line {line_num}: {line}")
+                    if comment is not None:
+                        if comment != "#":
+                            line_num += content.count("\n", last_pos, match.start())
+                            last_pos = match.start()
+                            comments.append(f"Line {line_num}: {comment}")
 
                     # Parse key=value pairs
-                    elif line and not line.startswith("#") and "=" in line:
-                        try:
-                            # Handle quoted values and special characters
-                            if line.count("=") == 1:
-                                key, value = line.split("=", 1)
-                            else:
-                                # Handle cases like KEY=value=something
-                                parts = line.split("=")
-                                key = parts[0]
-                                value = "=".join(parts[1:])
-
-                            key = key.strip()
-                            value = value.strip()
-
-                            # Remove quotes if present
-                            if value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                            elif value.startswith("'") and value.endswith("'"):
-                                value = value[1:-1]
-
-                            if key:  # Only add non-empty keys
-                                env_vars[key] = value
-
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Could not parse line {line_num} in {env_file}: {original_line}, {e}"
-                            )
+                    elif key:  # Only add non-empty keys
+                        # Remove matching surrounding quotes if present
+                        if (
+                            len(value) >= 2
+                            and value[0] == value[-1]
+                            and value[0] in ('"', "'")
+                        ):
+                            value = value[1:-1]
+
+                        env_vars[key] = value
 
                 if env_vars or comments:
-                    relative_path = str(env_file.relative_to(repo_path))
-                    env_configs[relative_path] = {
+                    rel_path = relative_path(env_file, prefix)
+                    env_configs[rel_path] = {
                         "variables": env_vars,
                         "comments": comments[:10],  # Limit comments to avoid bloat
-                        "total_lines": len(content.split("\n")),
+                        "total_lines": content.count("\n") + 1,
                         "variable_count": len(env_vars),
                     }
-                    self.logger.info(
-                        f"Parsed {relative_path}: {len(env_vars)} variables"
-                    )
+                    self.logger.info(f"Parsed {rel_path}: {len(env_vars)} variables")
 
             except Exception as e:
                 self.logger.warning(f"Error reading {env_file}: {str(e)}")
@@ -146,77 +180,117 @@ class EnvExtractor:
         Returns:
             Formatted markdown table string
         """
+        buf = io.StringIO()
+        self.write_env_table(env_configs, buf)
+        return buf.getvalue()
+
+    def write_env_table(self, env_configs: Dict, out: TextIO) -> None:
+        """
+        Write the environment configuration table to a stream.
+
+        Args:
+            env_configs: Dictionary of environment configurations
+            out: Text stream to write the table to
+        """
+        write = out.write
+
         if not env_configs:
-            return "## Environment Configuration Analysis\n\nNo environment configuration files found.\n\n"
-
-        env_table = "## Environment Configuration Analysis\n\n"
-        total_vars = sum(config["variable_count"] for config in env_configs.values())
-        env_table += f"**Summary**: {len(env_configs)} environment files with {total_vars} total variables\n\n"
-
-        for file_path, config in env_configs.items():
-            variables = config.get("variables", {})
-            comments = config.get("comments", [])
-            total_lines = config.get("total_lines", 0)
-            variable_count = config.get("variable_count", 0)
-
-            env_table += f"### {file_path}\n\n"
-            env_table += f"**File Stats**: {variable_count} variables, {total_lines} total lines\n\n"
-
-            if comments:
-                env_table += "**Key Comments**:\n"
-                for comment in comments[:5]:  # Show top 5 comments
-                    env_table += f"- {comment}\n"
-                env_table += "\n"
-
-            if variables:
-                env_table += "| Variable | Purpose/Description | Example Value |\n"
-                env_table += "|----------|--------------------|--------------|\n"
-
-                # Sort variables for better organization
-                sorted_vars = sorted(variables.items())
-                for var_name, var_value in sorted_vars:
-                    description = self._get_env_var_description(var_name)
-                    display_value = self._mask_sensitive_value(var_name, var_value)
-                    env_table += (
-                        f"| `{var_name}` | {description} | `{display_value}` |\n"
-                    )
-
-                env_table += "\n"
-            else:
-                env_table += "*No variables found (comments only)*\n\n"
+            write(
+                "## Environment Configuration Analysis\n\n"
+                "No environment configuration files found.\n\n"
+            )
+        else:
+            write("## Environment Configuration Analysis\n\n")
+            total_vars = sum(
+                config["variable_count"] for config in env_configs.values()
+            )
+            write(
+                f"**Summary**: {len(env_configs)} environment files with "
+                f"{total_vars} total variables\n\n"
+            )
 
-        return env_table
+            # Bind hot lookups to locals outside the per-variable loop
+            get_description = self._get_env_var_description
+            mask_value = self._mask_sensitive_value
+
+            # extract_env_config always sets every key of a file entry
+            for file_path, config in env_configs.items():
+                variables = config["variables"]
+                comments = config["comments"]
+                total_lines = config["total_lines"]
+                variable_count = config["variable_count"]
+
+                write(f"### {file_path}\n\n")
+                write(
+                    f"**File Stats**: {variable_count} variables, "
+                    f"{total_lines} total lines\n\n"
+                )
+
+                if comments:
+                    write("**Key Comments**:\n")
+                    for comment in comments[:5]:  # Show top 5 comments
+                        write(f"- {comment}\n")
+                    write("\n")
+
+                if variables:
+                    write("| Variable | Purpose/Description | Example Value |\n")
+                    write("|----------|--------------------|--------------|\n")
+
+                    # Sort variables for better organization
+                    sorted_vars = sorted(variables.items())
+                    for var_name, var_value in sorted_vars:
+                        description = get_description(var_name)
+                        display_value = mask_value(var_name, var_value)
+                        write(f"| `{var_name}` | {description} | `{display_value}` |\n")
+
+                    write("\n")
+                else:
+                    write("*No variables found (comments only)*\n\n")
+
+    def _find_env_files(self, repo_path: Path) -> Set[Path]:
+        """
+        Search the repository for environment configuration files.
 
-    def _should_ignore_file(self, file_path: Path) -> bool:
-        """Check if an environment file should be ignored."""
-        ignore_dirs = {
-            "node_modules",
-            "__pycache__",
-            ".git",
-            "target",
-            "dist",
-            "build",
-            "vendor",
-            ".cargo",
-            "bin",
-            "obj",
-            "out",
-            "debug",
-            "release",
-            "temp",
-            "tmp",
-            ".tmp",
-            "cache",
-            ".cache",
-        }
+        Args:
+            repo_path: Path to the repository
 
+        Returns:
+            Set of environment file paths
+        """
+        self.logger.info("Scanning for environment configuration files...")
+        # A set dedupes root-level hits that rglob also reports
+        found_env_files: Set[Path] = set()
+
+        for pattern in self.ENV_FILE_PATTERNS:
+            # Search in root directory
+            env_file = repo_path / pattern
+            if env_file.exists() and env_file.is_file():
+                found_env_files.add(env_file)
+
+            # Search recursively in subdirectories (but avoid common ignore dirs)
+            for env_file in repo_path.rglob(pattern):
+                if not self.is_ignored_path(env_file) and env_file.is_file():
+                    found_env_files.add(env_file)
+
+        return found_env_files
+
+    @classmethod
+    def is_env_file(cls, name: str) -> bool:
+        """Check if a file name is a known environment configuration file."""
+        return name in cls._ENV_FILE_NAMES
+
+    @classmethod
+    def is_ignored_path(cls, file_path: Path) -> bool:
+        """Check if an environment file or directory should be ignored."""
         for part in file_path.parts:
-            if part.lower() in ignore_dirs:
+            if part.lower() in cls._IGNORE_DIRS:
                 return True
 
         return False
 
-    def _get_env_var_description(self, var_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _get_env_var_description(var_name: str) -> str:
         """
         Get description for common environment variables.
 
@@ -262,26 +336,9 @@ class EnvExtractor:
                 return desc
 
         # Pattern matching
-        if "url" in var_lower or "uri" in var_lower:
-            return "Service connection URL/URI"
-        elif "key" in var_lower or "secret" in var_lower or "token" in var_lower:
-            return "Authentication/encryption key"
-        elif "host" in var_lower or "server" in var_lower:
-            return "Server/service host address"
-        elif "port" in var_lower:
-            return "Service port number"
-        elif "password" in var_lower or "pass" in var_lower:
-            return "Authentication password"
-        elif "user" in var_lower or "username" in var_lower:
-            return "Authentication username"
-        elif "email" in var_lower or "mail" in var_lower:
-            return "Email configuration"
-        elif "timeout" in var_lower:
-            return "Timeout configuration (seconds)"
-        elif "max" in var_lower or "limit" in var_lower:
-            return "Limit/threshold configuration"
-        elif "enable" in var_lower or "disable" in var_lower:
-            return "Feature toggle flag"
+        for pattern, desc in _DESCRIPTION_PATTERNS:
+            if pattern.search(var_lower):
+                return desc
 
         return "Configuration parameter"
 
@@ -296,22 +353,7 @@ class EnvExtractor:
         Returns:
             Masked value for display
         """
-        var_lower = var_name.lower()
-        sensitive_patterns = [
-            "password",
-            "secret",
-            "key",
-            "token",
-            "auth",
-            "credential",
-            "private",
-            "jwt",
-            "oauth",
-            "api_key",
-            "access_key",
-        ]
-
-        if any(pattern in var_lower for pattern in sensitive_patterns):
+        if self._is_sensitive(var_name):
             if len(var_value) > 4:
                 return var_value[:2] + "*" * (len(var_value) - 4) + var_value[-2:]
             else:
@@ -319,3 +361,17 @@ class EnvExtractor:
 
         # Show full value for non-sensitive variables
         return var_value
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _is_sensitive(var_name: str) -> bool:
+        """
+        Check whether a variable name looks like it holds a secret.
+
+        Args:
+            var_name: Variable name
+
+        Returns:
+            True if the value should be masked
+        """
+        return _SENSITIVE_RE.search(var_name.lower()) is not None
@@ -1,23 +1,238 @@
 # FilePath: src/repo_analyzer/core/file_processor.py
 
+import io
 import os
+import re
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, NamedTuple, TextIO, Tuple
 
 from config.settings import Settings
 from config.languages import LanguageConfig
 from ..utils.logging_utils import get_logger
 from ..utils.compression import SmartCompressor
+from ..utils.file_utils import (
+    BINARY_SNIFF_SIZE,
+    READ_BUFFER_SIZE,
+    decode_text,
+    relative_path,
+    root_prefix,
+)
+from .env_extractor import EnvExtractor
+
+# Lines worth repeating as context at the top of a continued chunk
+_CONTEXT_RE = re.compile(r"import |from |def |class |function ")
+
+
+class SourceFile(NamedTuple):
+    """A discovered source file: path relative to the repository and size."""
+
+    path: Path
+    size: int
 
 
 class FileProcessor:
     """Handles file scanning, filtering, and content processing."""
 
+    # Directory names that are never descended into
+    _IGNORE_DIRS: FrozenSet[str] = frozenset(
+        {
+            "node_modules",
+            "__pycache__",
+            ".git",
+            "target",
+            "dist",
+            "build",
+            "vendor",
+            ".cargo",
+            "bin",
+            "obj",
+            "out",
+            "debug",
+            "release",
+            ".vscode",
+            ".idea",
+            ".vs",
+            ".atom",
+            ".sublime-text",
+            ".eclipse",
+            "temp",
+            "tmp",
+            ".tmp",
+            "cache",
+            ".cache",
+            ".pytest_cache",
+            "coverage",
+            ".coverage",
+            ".nyc_output",
+            ".jest",
+            ".next",
+            ".nuxt",
+            ".angular",
+            ".svelte-kit",
+            "platforms",
+            "xcuserdata",
+            "project.xcworkspace",
+            "pods",
+            "carthage",
+            "derived_data",
+            "build_products",
+            "logs",
+            "log",
+            ".log",
+            ".terraform",
+            ".vagrant",
+            ".docker",
+            "k8s-temp",
+            ".ds_store",
+            "thumbs.db",
+        }
+    )
+
+    # File extensions for binaries, archives, media and other generated files
+    _IGNORE_EXTS: FrozenSet[str] = frozenset(
+        {
+            ".pyc",
+            ".pyo",
+            ".pyd",
+            ".class",
+            ".o",
+            ".obj",
+            ".so",
+            ".dll",
+            ".dylib",
+            ".exe",
+            ".bin",
+            ".deb",
+            ".rpm",
+            ".msi",
+            ".dmg",
+            ".pkg",
+            ".a",
+            ".lib",
+            ".exp",
+            ".pdb",
+            ".ilk",
+            ".idb",
+            ".zip",
+            ".tar",
+            ".gz",
+            ".bz2",
+            ".xz",
+            ".rar",
+            ".7z",
+            ".war",
+            ".ear",
+            ".jar",
+            ".png",
+            ".jpg",
+            ".jpeg",
+            ".gif",
+            ".bmp",
+            ".svg",
+            ".ico",
+            ".webp",
+            ".mp3",
+            ".mp4",
+            ".avi",
+            ".mov",
+            ".wav",
+            ".flv",
+            ".wmv",
+            ".webm",
+            ".tiff",
+            ".eps",
+            ".ai",
+            ".sketch",
+            ".pdf",
+            ".doc",
+            ".docx",
+            ".xls",
+            ".xlsx",
+            ".ppt",
+            ".pptx",
+            ".log",
+            ".tmp",
+            ".temp",
+            ".cache",
+            ".swp",
+            ".swo",
+            ".bak",
+            ".orig",
+            ".rej",
+            ".patch",
+            ".lock",
+            ".pid",
+            ".seed",
+            ".coverage",
+            ".map",
+        }
+    )
+
+    # Specific file names (lock files, OS metadata, build stats)
+    _IGNORE_FILES: FrozenSet[str] = frozenset(
+        {
+            "package-lock.json",
+            "yarn.lock",
+            "pnpm-lock.yaml",
+            "cargo.lock",
+            "composer.lock",
+            "pipfile.lock",
+            "poetry.lock",
+            "gemfile.lock",
+            "go.sum",
+            "mix.lock",
+            ".ds_store",
+            "thumbs.db",
+            "desktop.ini",
+            ".project",
+            ".classpath",
+            ".settings",
+            "webpack-stats.json",
+            "bundle-stats.json",
+            "stats.json",
+        }
+    )
+
+    # Important dotfiles that should not be ignored
+    _IMPORTANT_CONFIGS: FrozenSet[str] = frozenset(
+        {
+            ".env.example",
+            ".env.sample",
+            ".env.template",
+            ".env.local.example",
+            ".gitignore",
+            ".gitattributes",
+            ".dockerignore",
+            ".editorconfig",
+            ".eslintrc.js",
+            ".eslintrc.json",
+            ".eslintrc.yaml",
+            ".eslintrc.yml",
+            ".prettierrc",
+            ".prettierrc.json",
+            ".prettierrc.yaml",
+            ".prettierrc.yml",
+            ".babelrc",
+            ".babelrc.json",
+            ".swcrc",
+            ".browserslistrc",
+            ".nvmrc",
+            ".ruby-version",
+            ".python-version",
+            ".node-version",
+            ".golangci.yml",
+            ".golangci.yaml",
+            ".clang-format",
+            ".clang-tidy",
+        }
+    )
+
     def __init__(self):
         self.logger = get_logger(__name__)
         self.compressor = SmartCompressor()
 
-    def get_all_source_files(self, repo_path: Path) -> List[Path]:
+    def get_all_source_files(self, repo_path: Path) -> List[SourceFile]:
         """
         Get all source files with comprehensive language support.
 
@@ -25,36 +240,102 @@ class FileProcessor:
             repo_path: Path to the repository
 
         Returns:
-            List of relative paths to source files
+            List of source files (relative path and size captured during the scan)
         """
-        repo_path = Path(repo_path)
-        all_files = []
+        source_files, _ = self._scan_repository(Path(repo_path), collect_env=False)
+        return source_files
 
-        self.logger.info(f"Scanning directory: {repo_path}")
+    def scan_all(self, repo_path: Path) -> Tuple[List[SourceFile], List[Path]]:
+        """
+        Collect source files and environment files in a single directory walk.
 
-        total_scanned = 0
-        for root, dirs, files in os.walk(repo_path):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if not self._should_ignore_file(Path(root) / d)]
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            Tuple of (source files, paths to environment configuration files)
+        """
+        return self._scan_repository(Path(repo_path), collect_env=True)
+
+    def _scan_repository(
+        self, repo_path: Path, collect_env: bool
+    ) -> Tuple[List[SourceFile], List[Path]]:
+        """
+        Walk the repository once, dispatching entries to the active collectors.
+
+        Args:
+            repo_path: Path to the repository
+            collect_env: Whether to also collect environment files
 
-            for file in files:
-                total_scanned += 1
-                file_path = Path(root) / file
+        Returns:
+            Tuple of (source files, paths to environment configuration files)
+        """
+        all_files = []
+        env_files = []
 
-                if self._should_ignore_file(file_path):
-                    continue
+        self.logger.info(f"Scanning directory: {repo_path}")
 
-                if self._is_source_file(file_path):
-                    relative_path = file_path.relative_to(repo_path)
-                    all_files.append(relative_path)
+        total_scanned = 0
+        # Entry paths all start with the scan root, so relative paths are slices
+        prefix = root_prefix(repo_path)
+        # Each pending directory records which collectors still apply below it,
+        # since env files are searched for in some directories skipped for sources
+        pending_dirs = [(str(repo_path), True, collect_env)]
+        while pending_dirs:
+            current_dir, want_sources, want_env = pending_dirs.pop()
+            try:
+                entries = os.scandir(current_dir)
+            except OSError as e:
+                self.logger.warning(f"Cannot scan directory {current_dir}: {e}")
+                continue
+
+            with entries:
+                for entry in entries:
+                    # DirEntry type checks use the cached d_type, no extra stat
+                    if entry.is_dir(follow_symlinks=False):
+                        dir_path = Path(entry.path)
+                        sources_below = want_sources and not self._should_ignore_file(
+                            dir_path
+                        )
+                        env_below = want_env and not EnvExtractor.is_ignored_path(
+                            dir_path
+                        )
+                        if sources_below or env_below:
+                            pending_dirs.append((entry.path, sources_below, env_below))
+                        continue
+
+                    if not entry.is_file():
+                        continue
+
+                    if want_env and EnvExtractor.is_env_file(entry.name):
+                        env_files.append(Path(entry.path))
+
+                    if not want_sources:
+                        continue
+
+                    total_scanned += 1
+                    file_path = Path(entry.path)
+
+                    if self._should_ignore_file(file_path):
+                        continue
+
+                    if self._is_source_file(file_path):
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = 0
+                        all_files.append(
+                            SourceFile(Path(relative_path(entry.path, prefix)), size)
+                        )
 
         all_files.sort()
+        env_files.sort()
         self.logger.info(
             f"Found {len(all_files)} source files out of {total_scanned} total files"
         )
-        return all_files
+        return all_files, env_files
 
-    def prioritize_files(self, all_files: List[Path]) -> List[Path]:
+    def prioritize_files(self, all_files: List[SourceFile]) -> List[SourceFile]:
         """
         Prioritize files for analysis based on importance.
 
@@ -67,11 +348,11 @@ class FileProcessor:
         priority_files = []
         regular_files = []
 
-        for file_path in all_files:
-            if LanguageConfig.is_priority_file(file_path):
-                priority_files.append(file_path)
+        for source_file in all_files:
+            if LanguageConfig.is_priority_file(source_file.path):
+                priority_files.append(source_file)
             else:
-                regular_files.append(file_path)
+                regular_files.append(source_file)
 
         self.logger.info(
             f"Prioritized: {len(priority_files)} priority files, "
@@ -80,20 +361,42 @@ class FileProcessor:
         return priority_files + regular_files
 
     def create_file_chunk_content(
-        self, repo_path: Path, files_chunk: List[Path], chunk_num: int
+        self, repo_path: Path, files_chunk: List[SourceFile], chunk_num: int
     ) -> str:
         """
         Create content for a chunk of files with enhanced context.
 
         Args:
             repo_path: Path to the repository
-            files_chunk: List of files in this chunk
+            files_chunk: List of source files (path and size) in this chunk
             chunk_num: Chunk number
 
         Returns:
             Formatted content string for the chunk
         """
-        files_content = (
+        buf = io.StringIO()
+        self.write_file_chunk_content(repo_path, files_chunk, chunk_num, buf)
+        return buf.getvalue()
+
+    def write_file_chunk_content(
+        self,
+        repo_path: Path,
+        files_chunk: List[SourceFile],
+        chunk_num: int,
+        out: TextIO,
+    ) -> None:
+        """
+        Write content for a chunk of files with enhanced context to a stream.
+
+        Args:
+            repo_path: Path to the repository
+            files_chunk: List of source files (path and size) in this chunk
+            chunk_num: Chunk number
+            out: Text stream to write the content to
+        """
+        write = out.write
+
+        write(
             f"## Code Analysis Chunk {chunk_num} ({len(files_chunk)} files):\n"
             f"**Processing Mode**: {'Entire Files' if Settings.USE_ENTIRE_FILES else 'Chunked Files'}"
             f"{' with Smart Compression' if Settings.USE_SMART_COMPRESSION else ''}\n\n"
@@ -102,24 +405,16 @@ class FileProcessor:
         total_original_size = 0
         total_processed_size = 0
 
-        for file_path in files_chunk:
+        for file_path, original_size in files_chunk:
             full_path = repo_path / file_path
-
-            # Get original size for statistics
-            try:
-                original_size = full_path.stat().st_size
-                total_original_size += original_size
-            except OSError:
-                original_size = 0
+            total_original_size += original_size
 
             file_chunks = self._read_file_content_enhanced(full_path)
 
             # Add enhanced file context and metadata
-            files_content += f"### File: {file_path}\n"
-            files_content += (
-                f"**Type**: {LanguageConfig.get_file_type_description(file_path)}\n"
-            )
-            files_content += f"**Size**: {original_size:,} bytes"
+            write(f"### File: {file_path}\n")
+            write(f"**Type**: {LanguageConfig.get_file_type_description(file_path)}\n")
+            write(f"**Size**: {original_size:,} bytes")
 
             if Settings.USE_SMART_COMPRESSION:
                 processed_size = sum(len(chunk) for chunk in file_chunks)
@@ -130,32 +425,33 @@ class FileProcessor:
                         if original_size > 0
                         else 0
                     )
-                    files_content += (
+                    write(
                         f" → {processed_size:,} bytes (compressed {compression:.1f}%)"
                     )
 
             if len(file_chunks) > 1:
-                files_content += f", **Chunks**: {len(file_chunks)}"
+                write(f", **Chunks**: {len(file_chunks)}")
 
-            files_content += "\n\n"
+            write("\n\n")
 
+            # Enhanced syntax highlighting and context
+            syntax = LanguageConfig.get_syntax_highlighting(file_path)
             for i, chunk_content in enumerate(file_chunks):
                 if len(file_chunks) > 1:
-                    files_content += f"#### Part {i + 1}/{len(file_chunks)}\n"
+                    write(f"#### Part {i + 1}/{len(file_chunks)}\n")
 
-                # Enhanced syntax highlighting and context
-                syntax = LanguageConfig.get_syntax_highlighting(file_path)
-                files_content += f"```{syntax}\n{chunk_content}\n```\n\n"
+                write(f"```{syntax}\n{chunk_content}\n```\n\n")
 
         # Add processing summary
         if Settings.USE_SMART_COMPRESSION and total_original_size > 0:
             overall_compression = (1 - total_processed_size / total_original_size) * 100
-            files_content += f"**Chunk Processing Summary**: {total_original_size:,} → {total_processed_size:,} chars"
+            write(
+                f"**Chunk Processing Summary**: {total_original_size:,} → "
+                f"{total_processed_size:,} chars"
+            )
             if overall_compression > 5:
-                files_content += f" ({overall_compression:.1f}% compression)"
-            files_content += "\n\n"
-
-        return files_content
+                write(f" ({overall_compression:.1f}% compression)")
+            write("\n\n")
 
     def _should_ignore_file(self, file_path: Path) -> bool:
         """
@@ -169,209 +465,25 @@ class FileProcessor:
         """
         name = file_path.name.lower()
 
-        # Ignore patterns for directories and files
-        ignore_patterns = {
-            "dirs": {
-                "node_modules",
-                "__pycache__",
-                ".git",
-                "target",
-                "dist",
-                "build",
-                "vendor",
-                ".cargo",
-                "bin",
-                "obj",
-                "out",
-                "debug",
-                "release",
-                ".vscode",
-                ".idea",
-                ".vs",
-                ".atom",
-                ".sublime-text",
-                ".eclipse",
-                "temp",
-                "tmp",
-                ".tmp",
-                "cache",
-                ".cache",
-                ".pytest_cache",
-                "coverage",
-                ".coverage",
-                ".nyc_output",
-                ".jest",
-                ".next",
-                ".nuxt",
-                ".angular",
-                ".svelte-kit",
-                "platforms",
-                "xcuserdata",
-                "project.xcworkspace",
-                "pods",
-                "carthage",
-                "derived_data",
-                "build_products",
-                "logs",
-                "log",
-                ".log",
-                ".terraform",
-                ".vagrant",
-                ".docker",
-                "k8s-temp",
-                ".ds_store",
-                "thumbs.db",
-            },
-            "extensions": {
-                ".pyc",
-                ".pyo",
-                ".pyd",
-                ".class",
-                ".o",
-                ".obj",
-                ".so",
-                ".dll",
-                ".dylib",
-                ".exe",
-                ".bin",
-                ".deb",
-                ".rpm",
-                ".msi",
-                ".dmg",
-                ".pkg",
-                ".a",
-                ".lib",
-                ".exp",
-                ".pdb",
-                ".ilk",
-                ".idb",
-                ".zip",
-                ".tar",
-                ".gz",
-                ".bz2",
-                ".xz",
-                ".rar",
-                ".7z",
-                ".war",
-                ".ear",
-                ".jar",
-                ".png",
-                ".jpg",
-                ".jpeg",
-                ".gif",
-                ".bmp",
-                ".svg",
-                ".ico",
-                ".webp",
-                ".mp3",
-                ".mp4",
-                ".avi",
-                ".mov",
-                ".wav",
-                ".flv",
-                ".wmv",
-                ".webm",
-                ".tiff",
-                ".eps",
-                ".ai",
-                ".sketch",
-                ".pdf",
-                ".doc",
-                ".docx",
-                ".xls",
-                ".xlsx",
-                ".ppt",
-                ".pptx",
-                ".log",
-                ".tmp",
-                ".temp",
-                ".cache",
-                ".swp",
-                ".swo",
-                ".bak",
-                ".orig",
-                ".rej",
-                ".patch",
-                ".lock",
-                ".pid",
-                ".seed",
-                ".coverage",
-                ".map",
-            },
-            "files": {
-                "package-lock.json",
-                "yarn.lock",
-                "pnpm-lock.yaml",
-                "cargo.lock",
-                "composer.lock",
-                "pipfile.lock",
-                "poetry.lock",
-                "gemfile.lock",
-                "go.sum",
-                "mix.lock",
-                ".ds_store",
-                "thumbs.db",
-                "desktop.ini",
-                ".project",
-                ".classpath",
-                ".settings",
-                "webpack-stats.json",
-                "bundle-stats.json",
-                "stats.json",
-            },
-        }
-
         # Special handling for .env files
         if name.startswith(".env") and name != ".env.example":
             return True
 
         # Check directory patterns
         for part in file_path.parts:
-            if part.lower() in ignore_patterns["dirs"]:
+            if part.lower() in self._IGNORE_DIRS:
                 return True
 
         # Check file extensions
-        if file_path.suffix.lower() in ignore_patterns["extensions"]:
+        if file_path.suffix.lower() in self._IGNORE_EXTS:
             return True
 
         # Check specific file names
-        if name in ignore_patterns["files"]:
+        if name in self._IGNORE_FILES:
             return True
 
-        # Important configuration files (don't ignore)
-        important_configs = {
-            ".env.example",
-            ".env.sample",
-            ".env.template",
-            ".env.local.example",
-            ".gitignore",
-            ".gitattributes",
-            ".dockerignore",
-            ".editorconfig",
-            ".eslintrc.js",
-            ".eslintrc.json",
-            ".eslintrc.yaml",
-            ".eslintrc.yml",
-            ".prettierrc",
-            ".prettierrc.json",
-            ".prettierrc.yaml",
-            ".prettierrc.yml",
-            ".babelrc",
-            ".babelrc.json",
-            ".swcrc",
-            ".browserslistrc",
-            ".nvmrc",
-            ".ruby-version",
-            ".python-version",
-            ".node-version",
-            ".golangci.yml",
-            ".golangci.yaml",
-            ".clang-format",
-            ".clang-tidy",
-        }
-
         # Don't ignore important dotfiles
-        if name.startswith(".") and name not in important_configs:
+        if name.startswith(".") and name not in self._IMPORTANT_CONFIGS:
             return True
 
         return False
@@ -410,8 +522,12 @@ class FileProcessor:
             List of content chunks
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+                # Cheap binary sniff before reading and decoding the whole file
+                head = f.read(BINARY_SNIFF_SIZE)
+                if b"\x00" in head:
+                    return ["[Binary file - content not readable]"]
+                content = decode_text(head + f.read())
 
             # Apply smart compression if enabled
             if Settings.USE_SMART_COMPRESSION:
@@ -430,34 +546,22 @@ class FileProcessor:
 
                 # Split into chunks with better context preservation
                 chunks = []
-                for i in range(0, len(lines), Settings.CHUNK_LINES):
-                    chunk_lines = lines[i : i + Settings.CHUNK_LINES]
-                    chunk_content = "\n".join(chunk_lines)
-
-                    # Add chunk header with context info
-                    chunk_num = (i // Settings.CHUNK_LINES) + 1
-                    total_chunks = (
-                        len(lines) + Settings.CHUNK_LINES - 1
-                    ) // Settings.CHUNK_LINES
+                total_chunks = (
+                    len(lines) + Settings.CHUNK_LINES - 1
+                ) // Settings.CHUNK_LINES
+                lines_iter = iter(lines)
+                for chunk_num in range(1, total_chunks + 1):
+                    line_start = (chunk_num - 1) * Settings.CHUNK_LINES
+                    line_end = min(line_start + Settings.CHUNK_LINES, len(lines))
+                    chunk_content = "\n".join(islice(lines_iter, Settings.CHUNK_LINES))
 
                     # Try to preserve context by including some overlap
                     context_info = ""
-                    if i > 0:
+                    if Settings.INCLUDE_CHUNK_CONTEXT and line_start > 0:
                         # Look for imports/function definitions in previous chunks
-                        prev_lines = lines[max(0, i - 10) : i]
+                        prev_lines = lines[max(0, line_start - 10) : line_start]
                         imports = [
-                            line
-                            for line in prev_lines
-                            if any(
-                                pattern in line
-                                for pattern in [
-                                    "import ",
-                                    "from ",
-                                    "def ",
-                                    "class ",
-                                    "function ",
-                                ]
-                            )
+                            line for line in prev_lines if _CONTEXT_RE.search(line)
                         ]
                         if imports:
                             context_info = (
@@ -468,7 +572,7 @@ class FileProcessor:
                                 + "\n"
                             )
 
-                    header = f"[CHUNK {chunk_num}/{total_chunks} - Lines {i + 1}-{i + len(chunk_lines)}]{context_info}\n"
+                    header = f"[CHUNK {chunk_num}/{total_chunks} - Lines {line_start + 1}-{line_end}]{context_info}\n"
                     chunks.append(header + chunk_content)
 
                 return chunks
@@ -1,32 +1,157 @@
 # FilePath: src/repo_analyzer/core/git_handler.py
 
+import copy
+import os
+import re
+import shlex
 import subprocess
 import tempfile
 import shutil
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple, Union
+from weakref import WeakValueDictionary
 
 from config.settings import Settings
 from ..utils.logging_utils import get_logger
 
+try:
+    # Optional: reads repository metadata in-process instead of running git
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Marks the start of each command's output in the batched metadata script
+_GIT_INFO_SENTINEL = "@@repo_analyzer@@"
+
+# Metadata commands (arguments following "git") gathered by extract_git_info
+_GIT_INFO_COMMANDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("shallow", ("rev-parse", "--is-shallow-repository")),
+    ("remotes", ("remote", "-v")),
+    ("current_branch", ("branch", "--show-current")),
+    (
+        "branches",
+        (
+            "for-each-ref",
+            "--format=%(refname:lstrip=2)",
+            "refs/heads",
+            "refs/remotes/origin",
+        ),
+    ),
+    ("commit_count", ("rev-list", "--count", "HEAD")),
+    (
+        "last_commit",
+        ("log", "-1", "--pretty=format:%H%x00%an%x00%ae%x00%ad%x00%s", "--date=iso"),
+    ),
+)
+
+# Start of the shell script batching the metadata commands: exits 127 without
+# git and 128 outside a repository, before any section is printed
+_GIT_INFO_SCRIPT_PREAMBLE = (
+    "command -v git >/dev/null 2>&1 || exit 127\n"
+    "git rev-parse --git-dir >/dev/null 2>&1 || exit 128\n"
+)
+
+# Environment for every git process: the C locale skips locale setup, optional
+# locks are disabled so concurrent readers don't race on .git/index.lock, and
+# credential prompts fail fast instead of blocking until the timeout
+_GIT_ENV_OVERRIDES = {
+    "LC_ALL": "C",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+
+# One lock per repository, keyed by resolved path and shared by every handler,
+# so commands on the same working tree don't race on its index; entries
+# disappear once no caller holds the lock
+_REPO_LOCKS: "WeakValueDictionary[str, threading.Lock]" = WeakValueDictionary()
+_REPO_LOCKS_GUARD = threading.Lock()
+
+
+def _git_env() -> Dict[str, str]:
+    """Build the environment for git processes."""
+    return {**os.environ, **_GIT_ENV_OVERRIDES}
+
+
+def _release_resources(temp_dirs: List[Path], cat_file_procs: List[subprocess.Popen]):
+    """
+    Finalizer fallback for handlers that were never cleaned up explicitly.
+
+    Runs at garbage collection or interpreter exit, so it avoids logging and
+    must not reference the handler itself.
+
+    Args:
+        temp_dirs: Temporary directories still owned by the handler
+        cat_file_procs: cat-file processes still owned by the handler
+    """
+    for proc in cat_file_procs:
+        proc.kill()
+    for temp_dir in temp_dirs:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
 
 class GitHandler:
     """Handles Git operations for repository analysis."""
 
+    # Last path component of an SSH (git@host:owner/repo) or HTTP(S) URL,
+    # without a trailing ".git" or slash
+    _REPO_NAME_RE = re.compile(r"(?:[:/])([^/:]+?)(?:/?\.git)?/?$")
+
     def __init__(self):
         self.logger = get_logger(__name__)
         self._temp_dirs = []  # Track temporary directories for cleanup
+        self._temp_dirs_lock = threading.Lock()
+
+        # extract_git_info results keyed by (resolved repo path, HEAD sha, cap)
+        self._git_info_cache: Dict[Tuple[Path, str, Optional[int]], Dict] = {}
+
+        # Persistent `git cat-file --batch` processes, one per thread and repo;
+        # every process is also tracked here so cleanup() can stop them all
+        self._cat_file_local = threading.local()
+        self._cat_file_procs: List[subprocess.Popen] = []
+        self._cat_file_lock = threading.Lock()
+
+        # Removes whatever cleanup() has not, once the handler is unreachable
+        self._finalizer = weakref.finalize(
+            self, _release_resources, self._temp_dirs, self._cat_file_procs
+        )
 
     def clone_repository(
-        self, repo_url: str, target_dir: Optional[Path] = None
+        self,
+        repo_url: str,
+        target_dir: Optional[Path] = None,
+        branch: Optional[str] = None,
+        shallow: bool = False,
+        blobless: bool = False,
+        recurse_submodules: bool = False,
+        submodule_jobs: Optional[int] = None,
     ) -> Path:
         """
         Clone a remote repository to a local directory.
 
+        By default the full history, every branch and the tags are fetched, so
+        the Git information in the report is complete. A shallow clone only
+        fetches the latest commit of one branch: much faster for large
+        repositories, but the report then has no total commit count and lists
+        only the cloned branch. A blobless clone keeps all history and branches
+        and only downloads file contents for the checkout, a cheaper middle
+        ground for large repositories.
+
         Args:
             repo_url: URL of the remote repository
             target_dir: Optional target directory (creates temp dir if None)
+            branch: Branch to check out instead of the remote's default branch
+            shallow: Whether to fetch only the latest commit of the branch,
+                without tags
+            blobless: Whether to defer fetching file contents outside the
+                checkout (ignored for shallow clones, which have no history)
+            recurse_submodules: Whether to also clone submodules
+            submodule_jobs: Submodules cloned in parallel (defaults to CPU count)
 
         Returns:
             Path to the cloned repository
@@ -34,7 +159,8 @@ class GitHandler:
         if target_dir is None:
             # Create temporary directory
             temp_dir = Path(tempfile.mkdtemp(prefix="repo_analyzer_"))
-            self._temp_dirs.append(temp_dir)
+            with self._temp_dirs_lock:
+                self._temp_dirs.append(temp_dir)
             target_dir = temp_dir / self._extract_repo_name(repo_url)
 
         target_dir = Path(target_dir)
@@ -42,13 +168,25 @@ class GitHandler:
         try:
             self.logger.info(f"Cloning {repo_url} to {target_dir}")
 
+            clone_args = ["clone"]
+            if shallow:
+                clone_args += ["--depth", "1", "--single-branch", "--no-tags"]
+            elif blobless:
+                clone_args.append("--filter=blob:none")
+            if branch:
+                clone_args += ["--branch", branch]
+            if recurse_submodules:
+                clone_args += [
+                    "--recurse-submodules",
+                    "--jobs",
+                    str(submodule_jobs or os.cpu_count() or 4),
+                ]
+                if shallow:
+                    clone_args.append("--shallow-submodules")
+            clone_args += [repo_url, str(target_dir)]
+
             # Clone repository
-            result = subprocess.run(
-                ["git", "clone", repo_url, str(target_dir)],
-                capture_output=True,
-                text=True,
-                timeout=Settings.CLONE_TIMEOUT,
-            )
+            result = self._run_git(clone_args, timeout=Settings.CLONE_TIMEOUT)
 
             if result.returncode != 0:
                 raise RuntimeError(f"Git clone failed: {result.stderr}")
@@ -68,6 +206,80 @@ class GitHandler:
             self.logger.error(f"Clone operation failed: {str(e)}")
             raise
 
+    def clone_repositories(
+        self, repo_urls: List[str], max_workers: Optional[int] = None, **clone_options
+    ) -> Dict[str, Path]:
+        """
+        Clone several remote repositories concurrently.
+
+        Clones are network-bound, so they are overlapped on a thread pool.
+
+        Args:
+            repo_urls: URLs of the remote repositories
+            max_workers: Maximum concurrent clones (defaults to twice the CPU count)
+            **clone_options: Extra keyword arguments for clone_repository
+
+        Returns:
+            Dictionary mapping each successfully cloned URL to its local path
+        """
+        if not repo_urls:
+            return {}
+
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 1) * 2
+        max_workers = max(1, min(len(repo_urls), max_workers))
+
+        cloned = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.clone_repository, url, **clone_options): url
+                for url in repo_urls
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    cloned[url] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to clone {url}: {str(e)}")
+
+        self.logger.info(f"Cloned {len(cloned)} of {len(repo_urls)} repositories")
+        return cloned
+
+    def update_submodules(self, repo_path: Path, jobs: Optional[int] = None) -> None:
+        """
+        Initialize and update all submodules of a cloned repository in parallel.
+
+        Args:
+            repo_path: Path to the local repository
+            jobs: Submodules fetched in parallel (defaults to CPU count)
+        """
+        try:
+            self.logger.info(f"Updating submodules in {repo_path}")
+
+            with self._lock_for(repo_path):
+                result = self._run_git(
+                    [
+                        "submodule",
+                        "update",
+                        "--init",
+                        "--recursive",
+                        "--jobs",
+                        str(jobs or os.cpu_count() or 4),
+                    ],
+                    cwd=repo_path,
+                    timeout=Settings.CLONE_TIMEOUT,
+                )
+
+            if result.returncode != 0:
+                raise RuntimeError(f"Submodule update failed: {result.stderr}")
+
+        except subprocess.TimeoutExpired:
+            self.logger.error("Submodule update timed out")
+            raise RuntimeError("Submodule update timed out")
+        except Exception as e:
+            self.logger.error(f"Submodule update failed: {str(e)}")
+            raise
+
     def checkout_branch(self, repo_path: Path, branch: str) -> None:
         """
         Checkout a specific branch in the repository.
@@ -79,33 +291,30 @@ class GitHandler:
         try:
             self.logger.info(f"Checking out branch '{branch}' in {repo_path}")
 
-            # First, try to checkout existing branch
-            result = subprocess.run(
-                ["git", "checkout", branch],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
-            )
-
-            if result.returncode != 0:
-                # If that fails, try to checkout remote branch
-                self.logger.info(
-                    f"Local branch not found, trying remote branch origin/{branch}"
-                )
-                result = subprocess.run(
-                    ["git", "checkout", "-b", branch, f"origin/{branch}"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=Settings.GIT_COMMAND_TIMEOUT,
-                )
+            with self._lock_for(repo_path):
+                # First, try to checkout existing branch
+                result = self._run_git(["checkout", branch], cwd=repo_path)
 
                 if result.returncode != 0:
-                    raise RuntimeError(
-                        f"Failed to checkout branch '{branch}': {result.stderr}"
+                    # Shallow clones only track the cloned branch, so fetch it first
+                    if self._is_shallow(repo_path):
+                        self._fetch_branch(repo_path, branch)
+
+                    # If that fails, try to checkout remote branch
+                    self.logger.info(
+                        f"Local branch not found, trying remote branch origin/{branch}"
+                    )
+                    result = self._run_git(
+                        ["checkout", "-b", branch, f"origin/{branch}"], cwd=repo_path
                     )
 
+                    if result.returncode != 0:
+                        raise RuntimeError(
+                            f"Failed to checkout branch '{branch}': {result.stderr}"
+                        )
+
+                self._invalidate_git_info(repo_path)
+
             self.logger.info(f"Successfully checked out branch '{branch}'")
 
         except subprocess.TimeoutExpired:
@@ -115,12 +324,172 @@ class GitHandler:
             self.logger.error(f"Checkout failed: {str(e)}")
             raise
 
-    def extract_git_info(self, repo_path: Path) -> Dict:
+    def _lock_for(self, repo_path: Path) -> threading.Lock:
+        """
+        Get the lock serializing git commands on a repository.
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            Lock shared by all handlers working on the same repository
+        """
+        key = os.path.realpath(repo_path)
+        with _REPO_LOCKS_GUARD:
+            lock = _REPO_LOCKS.get(key)
+            if lock is None:
+                lock = _REPO_LOCKS[key] = threading.Lock()
+        return lock
+
+    def _run_git(
+        self,
+        args: List[str],
+        cwd: Optional[Path] = None,
+        timeout: Optional[int] = None,
+    ) -> "subprocess.CompletedProcess[str]":
+        """
+        Run a git command.
+
+        Args:
+            args: Arguments following "git"
+            cwd: Working directory for the command
+            timeout: Timeout in seconds (defaults to Settings.GIT_COMMAND_TIMEOUT)
+
+        Returns:
+            Completed process with decoded stdout and stderr
+        """
+        return self._run(["git", *args], cwd=cwd, timeout=timeout)
+
+    def _run(
+        self,
+        command: List[str],
+        cwd: Optional[Path] = None,
+        timeout: Optional[int] = None,
+    ) -> "subprocess.CompletedProcess[str]":
+        """
+        Run a command in the git environment.
+
+        Output is captured as bytes and decoded once, rather than through
+        text-mode pipes.
+
+        Args:
+            command: Command line to run
+            cwd: Working directory for the command
+            timeout: Timeout in seconds (defaults to Settings.GIT_COMMAND_TIMEOUT)
+
+        Returns:
+            Completed process with decoded stdout and stderr
+        """
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            capture_output=True,
+            timeout=timeout or Settings.GIT_COMMAND_TIMEOUT,
+            env=_git_env(),
+        )
+        return subprocess.CompletedProcess(
+            result.args,
+            result.returncode,
+            result.stdout.decode("utf-8", "replace"),
+            result.stderr.decode("utf-8", "replace"),
+        )
+
+    def _is_shallow(self, repo_path: Path) -> bool:
+        """Check whether the repository is a shallow clone."""
+        result = self._run_git(["rev-parse", "--is-shallow-repository"], cwd=repo_path)
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
+    def _fetch_branch(self, repo_path: Path, branch: str) -> None:
+        """Fetch the tip of a remote branch into a shallow clone."""
+        self.logger.info(f"Fetching branch '{branch}' into shallow clone")
+        result = self._run_git(
+            [
+                "fetch",
+                "--depth=1",
+                "origin",
+                f"+refs/heads/{branch}:refs/remotes/origin/{branch}",
+            ],
+            cwd=repo_path,
+            timeout=Settings.CLONE_TIMEOUT,
+        )
+
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to fetch branch '{branch}': {result.stderr}")
+
+    def extract_git_info(
+        self, repo_path: Path, commit_count_cap: Optional[int] = 200_000
+    ) -> Dict:
         """
         Extract comprehensive Git repository information.
 
+        Results are cached per repository and HEAD commit, so repeated calls
+        cost a single `git rev-parse HEAD`.
+
         Args:
             repo_path: Path to the repository
+            commit_count_cap: Stop counting commits past this many, reporting the
+                total as ">cap" (None walks the whole history)
+
+        Returns:
+            Dictionary containing Git information
+        """
+        cache_key = self._git_info_cache_key(repo_path, commit_count_cap)
+        if cache_key is not None and cache_key in self._git_info_cache:
+            return copy.deepcopy(self._git_info_cache[cache_key])
+
+        with self._lock_for(repo_path):
+            git_info = self._collect_git_info(repo_path, commit_count_cap)
+
+        if cache_key is not None and git_info["error"] is None:
+            self._git_info_cache[cache_key] = copy.deepcopy(git_info)
+
+        return git_info
+
+    def _git_info_cache_key(
+        self, repo_path: Path, commit_count_cap: Optional[int]
+    ) -> Optional[Tuple[Path, str, Optional[int]]]:
+        """Get the git_info cache key for a repository, or None if HEAD is unborn."""
+        if pygit2 is not None:
+            try:
+                git_dir = pygit2.discover_repository(str(repo_path))
+                if git_dir is None:
+                    return None
+                repo = pygit2.Repository(git_dir)
+                if repo.head_is_unborn:
+                    return None
+                return (
+                    Path(repo_path).resolve(),
+                    str(repo.head.target),
+                    commit_count_cap,
+                )
+            except Exception:
+                pass  # Fall back to asking git
+
+        try:
+            result = self._run_git(["rev-parse", "HEAD"], cwd=repo_path)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        return Path(repo_path).resolve(), result.stdout.strip(), commit_count_cap
+
+    def _invalidate_git_info(self, repo_path: Path) -> None:
+        """Drop cached git_info for a repository."""
+        resolved = Path(repo_path).resolve()
+        for key in [key for key in self._git_info_cache if key[0] == resolved]:
+            del self._git_info_cache[key]
+
+    def _collect_git_info(
+        self, repo_path: Path, commit_count_cap: Optional[int]
+    ) -> Dict:
+        """
+        Run git to gather the repository information for extract_git_info.
+
+        Args:
+            repo_path: Path to the repository
+            commit_count_cap: Maximum number of commits to count
 
         Returns:
             Dictionary containing Git information
@@ -136,30 +505,36 @@ class GitHandler:
             "error": None,
         }
 
+        if pygit2 is not None:
+            try:
+                return self._collect_git_info_pygit2(
+                    repo_path, copy.deepcopy(git_info), commit_count_cap
+                )
+            except Exception as e:
+                self.logger.debug(f"pygit2 metadata read failed, using git: {str(e)}")
+
         try:
-            # Check if it's a Git repository
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
-            )
+            commands = self._git_info_commands(commit_count_cap)
+            if shutil.which("sh") is not None:
+                sections = self._read_git_sections_batched(repo_path, commands)
+            else:
+                # No POSIX shell (e.g. on Windows), so run git once per section
+                sections = self._read_git_sections(repo_path, commands)
 
-            if result.returncode != 0:
+            if sections is None:
                 git_info["error"] = "Not a git repository"
                 return git_info
 
             git_info["is_git_repo"] = True
 
             # Extract remote URLs
-            self._extract_remote_urls(repo_path, git_info)
+            self._extract_remote_urls(sections, git_info)
 
             # Extract branch information
-            self._extract_branch_info(repo_path, git_info)
+            self._extract_branch_info(sections, git_info)
 
             # Extract commit information
-            self._extract_commit_info(repo_path, git_info)
+            self._extract_commit_info(sections, git_info, commit_count_cap)
 
         except subprocess.TimeoutExpired:
             git_info["error"] = "Git command timed out"
@@ -170,6 +545,94 @@ class GitHandler:
 
         return git_info
 
+    def _collect_git_info_pygit2(
+        self, repo_path: Path, git_info: Dict, commit_count_cap: Optional[int]
+    ) -> Dict:
+        """
+        Fill in repository information by reading the object database with pygit2.
+
+        Produces the same fields as the git subprocess path.
+
+        Args:
+            repo_path: Path to the repository
+            git_info: Git information dictionary with default values
+            commit_count_cap: Maximum number of commits to count
+
+        Returns:
+            Dictionary containing Git information
+        """
+        git_dir = pygit2.discover_repository(str(repo_path))
+        if git_dir is None:
+            git_info["error"] = "Not a git repository"
+            return git_info
+
+        repo = pygit2.Repository(git_dir)
+        git_info["is_git_repo"] = True
+
+        # Remote URLs
+        remotes = {
+            remote.name: {"fetch": remote.url, "push": remote.push_url or remote.url}
+            for remote in repo.remotes
+        }
+        if remotes:
+            git_info["remote_urls"] = remotes
+            primary = remotes.get("origin") or next(iter(remotes.values()))
+            git_info["repository_url"] = primary["fetch"]
+
+        # Current branch (HEAD names it even before the first commit)
+        if not repo.head_is_detached:
+            head_target = repo.lookup_reference("HEAD").target
+            if isinstance(head_target, str) and head_target.startswith("refs/heads/"):
+                git_info["current_branch"] = head_target[len("refs/heads/") :]
+
+        # All local branches plus those on origin
+        branches = set(repo.branches.local)
+        branches.update(
+            name[len("origin/") :]
+            for name in repo.branches.remote
+            if name.startswith("origin/") and name != "origin/HEAD"
+        )
+        git_info["all_branches"] = sorted(branches)
+
+        if repo.head_is_unborn:
+            return git_info
+
+        commit = repo.head.peel(pygit2.Commit)
+
+        # Total commit count (unknown for shallow clones, which lack history)
+        if not repo.is_shallow:
+            walk = repo.walk(commit.id)
+            if commit_count_cap:
+                walk = islice(walk, commit_count_cap + 1)
+            git_info["total_commits"] = self._format_commit_count(
+                sum(1 for _ in walk), commit_count_cap
+            )
+
+        # Last commit info, formatted like `git log --date=iso`
+        author = commit.author
+        author_tz = timezone(timedelta(minutes=author.offset))
+        subject_lines = commit.message.strip().split("\n\n", 1)[0].splitlines()
+        git_info["last_commit"] = {
+            "hash": str(commit.id),
+            "author_name": author.name,
+            "author_email": author.email,
+            "date": datetime.fromtimestamp(author.time, author_tz).strftime(
+                "%Y-%m-%d %H:%M:%S %z"
+            ),
+            "message": " ".join(line.strip() for line in subject_lines),
+        }
+
+        return git_info
+
+    @staticmethod
+    def _format_commit_count(
+        count: int, commit_count_cap: Optional[int]
+    ) -> Union[int, str]:
+        """Report a commit count that went past the cap as ">cap"."""
+        if commit_count_cap and count > commit_count_cap:
+            return f">{commit_count_cap}"
+        return count
+
     def generate_git_info_section(self, git_info: Dict) -> str:
         """Generate formatted Git repository information section."""
         if not git_info.get("is_git_repo"):
@@ -178,82 +641,280 @@ class GitHandler:
             else:
                 return "## Git Repository Information\n\n❌ Not a Git repository\n\n"
 
-        git_section = "## Git Repository Information\n\n"
+        parts = ["## Git Repository Information\n\n"]
 
         if git_info.get("repository_url"):
-            git_section += f"**Repository URL**: {git_info['repository_url']}\n\n"
+            parts.append(f"**Repository URL**: {git_info['repository_url']}\n\n")
 
         if git_info.get("current_branch"):
-            git_section += f"**Current Branch**: `{git_info['current_branch']}`\n\n"
+            parts.append(f"**Current Branch**: `{git_info['current_branch']}`\n\n")
 
         if git_info.get("all_branches"):
             branches = git_info["all_branches"]
-            git_section += (
-                f"**All Branches**: {', '.join(f'`{b}`' for b in branches[:10])}"
-            )
+            branch_list = ", ".join(f"`{b}`" for b in branches[:10])
+            parts.append(f"**All Branches**: {branch_list}")
             if len(branches) > 10:
-                git_section += f" (and {len(branches) - 10} more)"
-            git_section += "\n\n"
+                parts.append(f" (and {len(branches) - 10} more)")
+            parts.append("\n\n")
 
         if git_info.get("total_commits"):
-            git_section += f"**Total Commits**: {git_info['total_commits']}\n\n"
+            parts.append(f"**Total Commits**: {git_info['total_commits']}\n\n")
 
         if git_info.get("last_commit"):
             commit = git_info["last_commit"]
-            git_section += "### Last Commit\n\n"
-            git_section += f"- **Hash**: `{commit.get('hash', 'N/A')}`\n"
-            git_section += (
+            parts.append("### Last Commit\n\n")
+            parts.append(f"- **Hash**: `{commit.get('hash', 'N/A')}`\n")
+            parts.append(
                 f"- **Author**: {commit.get('author_name', 'N/A')} "
                 f"({commit.get('author_email', 'N/A')})\n"
             )
-            git_section += f"- **Date**: {commit.get('date', 'N/A')}\n"
-            git_section += f"- **Message**: {commit.get('message', 'N/A')}\n\n"
+            parts.append(f"- **Date**: {commit.get('date', 'N/A')}\n")
+            parts.append(f"- **Message**: {commit.get('message', 'N/A')}\n\n")
 
-        return git_section
+        return "".join(parts)
 
-    def cleanup(self):
-        """Clean up temporary directories."""
-        for temp_dir in self._temp_dirs:
+    def read_blob(
+        self, repo_path: Path, revision: str, file_path: str
+    ) -> Optional[bytes]:
+        """
+        Read a file's content at a revision without spawning a git process.
+
+        Requests go through a long-running `git cat-file --batch` process owned
+        by the calling thread, so repeated lookups skip the fork+exec cost.
+
+        Args:
+            repo_path: Path to the repository
+            revision: Commit, branch or tag to read from
+            file_path: Path of the file relative to the repository root
+
+        Returns:
+            Raw file content, or None if the object does not exist
+        """
+        proc = self._ensure_cat_file_proc(repo_path)
+        stdin, stdout = proc.stdin, proc.stdout
+        if stdin is None or stdout is None:
+            raise RuntimeError("git cat-file process has no pipes")
+
+        stdin.write(f"{revision}:{file_path}\n".encode("utf-8"))
+        stdin.flush()
+
+        # Header is "<sha> <type> <size>", or "<name> missing" / "<name> ambiguous"
+        # where the name may itself contain spaces
+        header = stdout.readline().rstrip(b"\n")
+        if not header:
+            raise RuntimeError("git cat-file process exited unexpectedly")
+
+        if header.endswith((b" missing", b" ambiguous")):
+            return None
+
+        fields = header.rsplit(None, 2)
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+
+        # Content is followed by a single newline terminator
+        content = stdout.read(int(fields[2]) + 1)
+        return content[:-1]
+
+    def _ensure_cat_file_proc(self, repo_path: Path) -> subprocess.Popen:
+        """
+        Get or start the calling thread's cat-file process for a repository.
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            Running `git cat-file --batch` process
+        """
+        procs = getattr(self._cat_file_local, "procs", None)
+        if procs is None:
+            procs = self._cat_file_local.procs = {}
+
+        key = str(repo_path)
+        proc = procs.get(key)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                ["git", "-C", key, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=_git_env(),
+            )
+            procs[key] = proc
+            with self._cat_file_lock:
+                self._cat_file_procs.append(proc)
+
+        return proc
+
+    def _close_cat_file_procs(self) -> None:
+        """Stop all cat-file processes started by this handler."""
+        with self._cat_file_lock:
+            procs = self._cat_file_procs[:]
+            self._cat_file_procs.clear()
+
+        for proc in procs:
             try:
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
-                    self.logger.info(f"Cleaned up temporary directory: {temp_dir}")
+                # Closing stdin makes cat-file exit after its current request
+                if proc.stdin:
+                    proc.stdin.close()
+                proc.wait(timeout=Settings.GIT_COMMAND_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
             except Exception as e:
-                self.logger.warning(f"Failed to clean up {temp_dir}: {str(e)}")
+                self.logger.warning(f"Failed to stop git cat-file process: {str(e)}")
+            finally:
+                if proc.stdout:
+                    proc.stdout.close()
+
+    def cleanup(self):
+        """Clean up temporary directories and cat-file processes."""
+        self._close_cat_file_procs()
+
+        with self._temp_dirs_lock:
+            temp_dirs = self._temp_dirs[:]
+            self._temp_dirs.clear()
 
-        self._temp_dirs.clear()
+        if not temp_dirs:
+            return
+
+        # Removal is dominated by unlink calls, so trees are deleted in parallel
+        with ThreadPoolExecutor(max_workers=min(4, len(temp_dirs))) as executor:
+            for _ in executor.map(self._remove_temp_dir, temp_dirs):
+                pass
+
+    def _remove_temp_dir(self, temp_dir: Path) -> None:
+        """Remove one temporary directory, logging the outcome."""
+        try:
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+                self.logger.info(f"Cleaned up temporary directory: {temp_dir}")
+        except Exception as e:
+            self.logger.warning(f"Failed to clean up {temp_dir}: {str(e)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
 
     def _extract_repo_name(self, repo_url: str) -> str:
         """Extract repository name from URL."""
-        try:
-            if repo_url.endswith(".git"):
-                repo_url = repo_url[:-4]
+        match = self._REPO_NAME_RE.search(repo_url)
+        return match.group(1) if match else "repository"
 
-            # Handle different URL formats
-            if repo_url.startswith("git@"):
-                # SSH format: git@github.com:user/repo
-                return repo_url.split(":")[-1].split("/")[-1]
-            else:
-                # HTTP(S) format
-                parsed = urlparse(repo_url)
-                return parsed.path.strip("/").split("/")[-1]
-        except Exception:
-            return "repository"
-
-    def _extract_remote_urls(self, repo_path: Path, git_info: Dict) -> None:
-        """Extract remote URLs from repository."""
-        try:
-            result = subprocess.run(
-                ["git", "remote", "-v"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
+    @staticmethod
+    def _git_info_commands(
+        commit_count_cap: Optional[int],
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Build the command lines of the metadata sections.
+
+        Args:
+            commit_count_cap: Maximum number of commits to count
+
+        Returns:
+            List of (section name, command line) pairs
+        """
+        commands = []
+        for name, args in _GIT_INFO_COMMANDS:
+            command = ["git", *args]
+            if name == "commit_count" and commit_count_cap:
+                # One past the cap tells a capped walk apart from an exact count
+                command.insert(-1, f"--max-count={commit_count_cap + 1}")
+            commands.append((name, command))
+
+        return commands
+
+    def _read_git_sections_batched(
+        self, repo_path: Path, commands: List[Tuple[str, List[str]]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Run the metadata commands in one shell process and split their output.
+
+        Each command's output is printed behind a sentinel line, so Python
+        spawns one process instead of one per section.
+
+        Args:
+            repo_path: Path to the repository
+            commands: List of (section name, command line) pairs
+
+        Returns:
+            Dictionary mapping section name to that command's output, or None
+            if the path is not a git repository
+
+        Raises:
+            FileNotFoundError: If git is not installed
+        """
+        script = (
+            _GIT_INFO_SCRIPT_PREAMBLE
+            + "".join(
+                f"printf '\\n%s\\n' '{_GIT_INFO_SENTINEL} {name}'\n"
+                f"{shlex.join(command)} 2>/dev/null\n"
+                for name, command in commands
             )
+            + "exit 0\n"
+        )
+        result = self._run(["sh", "-c", script], cwd=repo_path)
+
+        if result.returncode == 127:
+            raise FileNotFoundError("git")
+
+        if result.returncode != 0:
+            return None
+
+        return self._split_git_sections(result.stdout)
+
+    def _read_git_sections(
+        self, repo_path: Path, commands: List[Tuple[str, List[str]]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Run the metadata commands one process at a time.
+
+        Args:
+            repo_path: Path to the repository
+            commands: List of (section name, command line) pairs
+
+        Returns:
+            Dictionary mapping section name to that command's output, or None
+            if the path is not a git repository
+
+        Raises:
+            FileNotFoundError: If git is not installed
+        """
+        if self._run_git(["rev-parse", "--git-dir"], cwd=repo_path).returncode != 0:
+            return None
 
-            if result.returncode == 0 and result.stdout.strip():
+        return {
+            name: self._run(command, cwd=repo_path).stdout.strip()
+            for name, command in commands
+        }
+
+    @staticmethod
+    def _split_git_sections(output: str) -> Dict[str, str]:
+        """
+        Split batched metadata script output into per-command sections.
+
+        Args:
+            output: Stdout of the metadata script
+
+        Returns:
+            Dictionary mapping section name to that command's output
+        """
+        sections = {}
+        for chunk in output.split(f"\n{_GIT_INFO_SENTINEL} ")[1:]:
+            name, _, body = chunk.partition("\n")
+            sections[name] = body.strip()
+
+        return sections
+
+    def _extract_remote_urls(self, sections: Dict[str, str], git_info: Dict) -> None:
+        """Extract remote URLs from the metadata sections."""
+        try:
+            output = sections.get("remotes")
+
+            if output:
                 remotes = {}
-                for line in result.stdout.strip().split("\n"):
+                for line in output.split("\n"):
                     if line.strip():
                         parts = line.split()
                         if len(parts) >= 2:
@@ -287,70 +948,48 @@ class GitHandler:
         except Exception as e:
             self.logger.warning(f"Failed to extract remote URLs: {str(e)}")
 
-    def _extract_branch_info(self, repo_path: Path, git_info: Dict) -> None:
-        """Extract branch information from repository."""
+    def _extract_branch_info(self, sections: Dict[str, str], git_info: Dict) -> None:
+        """Extract branch information from the metadata sections."""
         try:
-            # Get current branch
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                git_info["current_branch"] = result.stdout.strip()
-
-            # Get all branches
-            result = subprocess.run(
-                ["git", "branch", "-a"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                branches = []
-                for line in result.stdout.strip().split("\n"):
-                    branch = line.strip()
-                    if branch and not branch.startswith("remotes/origin/HEAD"):
-                        # Clean up branch name
-                        branch = branch.replace("* ", "").replace("remotes/origin/", "")
-                        if branch not in branches:
-                            branches.append(branch)
+            # Current branch
+            current_branch = sections.get("current_branch")
+            if current_branch:
+                git_info["current_branch"] = current_branch
+
+            # All branches
+            output = sections.get("branches")
+            if output:
+                # Names are "branch" for local and "origin/branch" for remote refs
+                branches = {
+                    name[len("origin/") :] if name.startswith("origin/") else name
+                    for name in output.split("\n")
+                    if name and name != "origin/HEAD"
+                }
                 git_info["all_branches"] = sorted(branches)
 
         except Exception as e:
             self.logger.warning(f"Failed to extract branch info: {str(e)}")
 
-    def _extract_commit_info(self, repo_path: Path, git_info: Dict) -> None:
-        """Extract commit information from repository."""
+    def _extract_commit_info(
+        self,
+        sections: Dict[str, str],
+        git_info: Dict,
+        commit_count_cap: Optional[int] = None,
+    ) -> None:
+        """Extract commit information from the metadata sections."""
         try:
-            # Get total commit count
-            result = subprocess.run(
-                ["git", "rev-list", "--count", "HEAD"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                git_info["total_commits"] = int(result.stdout.strip())
-
-            # Get last commit info
-            result = subprocess.run(
-                ["git", "log", "-1", "--pretty=format:%H|%an|%ae|%ad|%s", "--date=iso"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=Settings.GIT_COMMAND_TIMEOUT,
-            )
+            # Total commit count (unknown for shallow clones, which lack history)
+            commit_count = sections.get("commit_count")
+            if commit_count and sections.get("shallow") != "true":
+                git_info["total_commits"] = self._format_commit_count(
+                    int(commit_count), commit_count_cap
+                )
 
-            if result.returncode == 0 and result.stdout.strip():
-                commit_parts = result.stdout.strip().split("|")
+            # Last commit info
+            last_commit = sections.get("last_commit")
+            if last_commit:
+                # NUL-separated, since any other separator can occur in the subject
+                commit_parts = last_commit.split("\x00", 4)
                 if len(commit_parts) >= 5:
                     git_info["last_commit"] = {
                         "hash": commit_parts[0],
@@ -362,7 +1001,3 @@ class GitHandler:
 
         except Exception as e:
             self.logger.warning(f"Failed to extract commit info: {str(e)}")
-
-    def __del__(self):
-        """Ensure cleanup on object destruction."""
-        self.cleanup()
@@ -1,7 +1,7 @@
 # FilePath: src/repo_analyzer/llm/base.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class LLMProvider(ABC):
@@ -25,6 +25,22 @@ class LLMProvider(ABC):
         """
         pass
 
+    def generate_responses(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate responses for several independent prompts.
+
+        Providers that support concurrent requests override this; the default
+        issues the prompts one at a time.
+
+        Args:
+            prompts: The input prompts
+            **kwargs: Additional parameters specific to the provider
+
+        Returns:
+            Generated response texts, in prompt order
+        """
+        return [self.generate_response(prompt, **kwargs) for prompt in prompts]
+
     @abstractmethod
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -1,12 +1,102 @@
 # src/repo_analyzer/llm/claude.py
 
-from typing import Dict, Any, Optional
-import anthropic
+import asyncio
+import functools
+import threading
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
 
 from config.settings import Settings
 from ..utils.logging_utils import get_logger
 from .base import LLMProvider
 
+# Clients shared by every provider instance, keyed by (API key, base URL), so
+# requests reuse kept-alive connections instead of repeating TLS handshakes.
+# Async clients are bound to an event loop and pooled per loop.
+_ClientPool = Dict[Tuple[str, str], Any]
+_CLIENT_POOL: _ClientPool = {}
+_ASYNC_CLIENT_POOL: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientPool]"
+) = weakref.WeakKeyDictionary()
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _get_shared_client(api_key: str, base_url: str, async_client: bool = False):
+    """
+    Get the pooled Anthropic client for an API key and base URL.
+
+    Args:
+        api_key: Anthropic API key
+        base_url: API base URL
+        async_client: Whether to return an AsyncAnthropic client for the running
+            event loop instead of a sync client
+
+    Returns:
+        Shared Anthropic or AsyncAnthropic client
+    """
+    # Imported here so loading this module doesn't pay anthropic's import cost
+    import anthropic
+
+    key = (api_key, base_url)
+
+    with _CLIENT_POOL_LOCK:
+        if async_client:
+            pool = _ASYNC_CLIENT_POOL.setdefault(asyncio.get_running_loop(), {})
+        else:
+            pool = _CLIENT_POOL
+
+        client = pool.get(key)
+        if client is None:
+            # The SDK's default HTTP client already keeps connections alive
+            client_class = (
+                anthropic.AsyncAnthropic if async_client else anthropic.Anthropic
+            )
+            client = client_class(api_key=api_key, base_url=base_url)
+            pool[key] = client
+
+    return client
+
+
+async def _close_async_clients(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close the pooled async clients of an event loop that is about to end.
+
+    Args:
+        loop: Event loop whose clients are closed
+    """
+    with _CLIENT_POOL_LOCK:
+        pool = _ASYNC_CLIENT_POOL.pop(loop, {})
+
+    for client in pool.values():
+        await client.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_token_encoder():
+    """Load the BPE encoder used to count tokens, or None if it is unavailable."""
+    try:
+        import tiktoken
+
+        # Claude's tokenizer is not public; cl100k_base is a close proxy
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # The encoding is downloaded on first use, which fails offline; the
+        # None result is cached so the fallback estimate is used from then on
+        get_logger(__name__).debug(f"Token encoder unavailable: {e}")
+        return None
+
+
+# Kept small: each cached entry keeps a whole prompt string alive
+@functools.lru_cache(maxsize=128)
+def _count_tokens(text: str) -> int:
+    """Count the tokens in text, memoized for repeated prompt checks."""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        # Rough estimation: ~4 characters per token for Claude
+        return len(text) // 4
+
+    return len(encoder.encode(text, disallowed_special=()))
+
 
 class ClaudeProvider(LLMProvider):
     """Claude LLM provider implementation."""
@@ -22,8 +112,8 @@ class ClaudeProvider(LLMProvider):
     def _initialize_client(self):
         """Initialize the Anthropic client."""
         try:
-            self.client = anthropic.Anthropic(
-                api_key=Settings.ANTHROPIC_API_KEY, base_url=Settings.ANTHROPIC_BASE_URL
+            self.client = _get_shared_client(
+                Settings.ANTHROPIC_API_KEY, Settings.ANTHROPIC_BASE_URL
             )
             self.logger.info(f"Initialized Claude client with model: {self.model}")
         except Exception as e:
@@ -51,7 +141,7 @@ class ClaudeProvider(LLMProvider):
         try:
             self.logger.debug(f"Generating response with model: {self.model}")
 
-            response_text = ""
+            chunks = []
             with self.client.messages.stream(
                 model=self.model,
                 max_tokens=params.get("max_tokens", Settings.MAX_TOKENS),
@@ -59,8 +149,9 @@ class ClaudeProvider(LLMProvider):
                 messages=[{"role": "user", "content": prompt}],
             ) as stream:
                 for text in stream.text_stream:
-                    response_text += text
+                    chunks.append(text)
 
+            response_text = "".join(chunks)
             self.logger.debug(
                 f"Generated response length: {len(response_text)} characters"
             )
@@ -70,6 +161,85 @@ class ClaudeProvider(LLMProvider):
             self.logger.error(f"Error generating response: {str(e)}")
             raise
 
+    def generate_responses(
+        self, prompts: List[str], concurrency: Optional[int] = None, **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for several independent prompts concurrently.
+
+        Args:
+            prompts: The input prompts
+            concurrency: Maximum requests in flight
+                (defaults to Settings.MAX_CONCURRENT_REQUESTS)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Generated response texts, in prompt order
+        """
+
+        async def run() -> List[str]:
+            try:
+                return await self.generate_responses_async(
+                    prompts, concurrency=concurrency, **kwargs
+                )
+            finally:
+                # The loop ends with this run, so release its clients' connections
+                await _close_async_clients(asyncio.get_running_loop())
+
+        return asyncio.run(run())
+
+    async def generate_responses_async(
+        self, prompts: List[str], concurrency: Optional[int] = None, **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for several prompts, overlapping the requests.
+
+        Args:
+            prompts: The input prompts
+            concurrency: Maximum requests in flight
+                (defaults to Settings.MAX_CONCURRENT_REQUESTS)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Generated response texts, in prompt order
+        """
+        client = self._get_async_client()
+
+        params = self.get_default_parameters()
+        params.update(kwargs)
+
+        semaphore = asyncio.Semaphore(concurrency or Settings.MAX_CONCURRENT_REQUESTS)
+
+        async def generate(prompt: str) -> str:
+            async with semaphore:
+                chunks = []
+                async with client.messages.stream(
+                    model=self.model,
+                    max_tokens=params.get("max_tokens", Settings.MAX_TOKENS),
+                    temperature=params.get("temperature", Settings.TEMPERATURE),
+                    messages=[{"role": "user", "content": prompt}],
+                ) as stream:
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+
+                return "".join(chunks)
+
+        try:
+            self.logger.debug(
+                f"Generating {len(prompts)} responses with model: {self.model}"
+            )
+            return await asyncio.gather(*(generate(prompt) for prompt in prompts))
+
+        except Exception as e:
+            self.logger.error(f"Error generating responses: {str(e)}")
+            raise
+
+    def _get_async_client(self):
+        """Get the shared async Anthropic client for the running event loop."""
+        return _get_shared_client(
+            Settings.ANTHROPIC_API_KEY, Settings.ANTHROPIC_BASE_URL, async_client=True
+        )
+
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current Claude model."""
         return {
@@ -121,7 +291,8 @@ class ClaudeProvider(LLMProvider):
     def estimate_tokens(self, text: str) -> int:
         """
         Estimate the number of tokens in the given text.
-        This is a rough estimation for Claude models.
+        Uses a BPE tokenizer when tiktoken is installed, otherwise a rough
+        character-based estimate.
 
         Args:
             text: Input text
@@ -129,8 +300,7 @@ class ClaudeProvider(LLMProvider):
         Returns:
             Estimated token count
         """
-        # Rough estimation: ~4 characters per token for Claude
-        return len(text) // 4
+        return _count_tokens(text)
 
     def check_token_limit(self, prompt: str) -> bool:
         """
@@ -1,20 +1,28 @@
 # src/repo_analyzer/llm/factory.py
 
-from typing import Optional, Dict, Type
+import hashlib
+import importlib
+import threading
+from typing import Optional, Dict, Set, Tuple, Type, Union
 
 from config.settings import Settings
 from ..utils.logging_utils import get_logger
 from .base import LLMProvider
-from .claude import ClaudeProvider
 
 
 class LLMFactory:
     """Factory for creating LLM provider instances."""
 
-    _providers: Dict[str, Type[LLMProvider]] = {
-        "claude": ClaudeProvider,
+    # Provider classes, or "module:Class" references (relative to this package
+    # when the module starts with ".") imported on first use
+    _providers: Dict[str, Union[str, Type[LLMProvider]]] = {
+        "claude": ".claude:ClaudeProvider",
     }
 
+    # (provider, model, API key fingerprint) combinations already validated
+    _validated: Set[Tuple[str, str, str]] = set()
+    _validated_lock = threading.Lock()
+
     @classmethod
     def create_provider(
         cls, provider_name: str, model: Optional[str] = None, **kwargs
@@ -45,9 +53,9 @@ class LLMFactory:
                 f"Available providers: {available}"
             )
 
-        provider_class = cls._providers[provider_name]
-
         try:
+            provider_class = cls._load_provider_class(provider_name)
+
             # Resolve model to a concrete value if None
             resolved_model = model or cls._get_default_model(provider_name)
 
@@ -56,11 +64,18 @@ class LLMFactory:
             )
             provider = provider_class(model=resolved_model, **kwargs)
 
-            # Validate configuration
-            if not provider.validate_configuration():
-                raise RuntimeError(
-                    f"Invalid configuration for {provider_name} provider"
-                )
+            # Validate configuration once per provider, model and API key
+            validation_key = cls._validation_key(provider_name, resolved_model)
+            with cls._validated_lock:
+                already_validated = validation_key in cls._validated
+
+            if not already_validated:
+                if not provider.validate_configuration():
+                    raise RuntimeError(
+                        f"Invalid configuration for {provider_name} provider"
+                    )
+                with cls._validated_lock:
+                    cls._validated.add(validation_key)
 
             logger.info(f"Successfully created {provider_name} provider")
             return provider
@@ -71,23 +86,45 @@ class LLMFactory:
                 f"Failed to initialize {provider_name} provider: {str(e)}"
             )
 
+    @classmethod
+    def _validation_key(cls, provider_name: str, model: str) -> Tuple[str, str, str]:
+        """
+        Build the cache key for a validated provider configuration.
+
+        Args:
+            provider_name: Name of the provider
+            model: Resolved model name
+
+        Returns:
+            Tuple of provider name, model and a fingerprint of the API key
+        """
+        api_key = Settings.ANTHROPIC_API_KEY or ""
+        fingerprint = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return provider_name, model or "", fingerprint
+
     @classmethod
     def get_available_providers(cls) -> list:
         """Get list of available provider names."""
         return list(cls._providers.keys())
 
     @classmethod
-    def register_provider(cls, name: str, provider_class: Type[LLMProvider]) -> None:
+    def register_provider(
+        cls, name: str, provider_class: Union[str, Type[LLMProvider]]
+    ) -> None:
         """
         Register a new LLM provider.
 
         Args:
             name: Provider name
-            provider_class: Provider class that inherits from LLMProvider
+            provider_class: Provider class that inherits from LLMProvider, or a
+                "module:Class" reference to import when the provider is first used
         """
         logger = get_logger(__name__)
 
-        if not issubclass(provider_class, LLMProvider):
+        if isinstance(provider_class, str):
+            if provider_class.count(":") != 1:
+                raise ValueError("Provider reference must look like 'module:Class'")
+        elif not issubclass(provider_class, LLMProvider):
             raise ValueError("Provider class must inherit from LLMProvider")
 
         cls._providers[name.lower()] = provider_class
@@ -109,13 +146,13 @@ class LLMFactory:
         if provider_name not in cls._providers:
             raise ValueError(f"Unknown provider: {provider_name}")
 
-        provider_class = cls._providers[provider_name]
+        class_name = cls._provider_class_name(provider_name)
 
         # Return provider-specific information
         if provider_name == "claude":
             return {
                 "name": provider_name,
-                "class": provider_class.__name__,
+                "class": class_name,
                 "supported_models": [
                     "claude-3-7-sonnet-20250627",
                     "claude-3-5-sonnet-20241022",
@@ -130,11 +167,49 @@ class LLMFactory:
         # Fallback for unknown providers
         return {
             "name": provider_name,
-            "class": provider_class.__name__,
+            "class": class_name,
             "supported_models": ["Unknown"],
             "default_model": "Unknown",
         }
 
+    @classmethod
+    def _load_provider_class(cls, provider_name: str) -> Type[LLMProvider]:
+        """
+        Get a registered provider class, importing it on first use.
+
+        Args:
+            provider_name: Name of the provider
+
+        Returns:
+            Provider class
+
+        Raises:
+            ValueError: If the reference does not name an LLMProvider subclass
+        """
+        provider = cls._providers[provider_name]
+        if not isinstance(provider, str):
+            return provider
+
+        module_name, class_name = provider.split(":")
+        module = importlib.import_module(module_name, package=__package__)
+        provider_class = getattr(module, class_name)
+
+        if not (
+            isinstance(provider_class, type) and issubclass(provider_class, LLMProvider)
+        ):
+            raise ValueError(f"{provider} does not name an LLMProvider subclass")
+
+        cls._providers[provider_name] = provider_class
+        return provider_class
+
+    @classmethod
+    def _provider_class_name(cls, provider_name: str) -> str:
+        """Get a registered provider's class name without importing it."""
+        provider = cls._providers[provider_name]
+        if isinstance(provider, str):
+            return provider.split(":")[1]
+        return provider.__name__
+
     @classmethod
     def _get_default_model(cls, provider_name: str) -> str:
         """
@@ -1,41 +1,97 @@
 # FilePath: src/repo_analyzer/output/formatters.py
 
+import functools
+import re
 import time
-from typing import Dict, Any
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..utils.logging_utils import get_logger
 
+# Descriptions of environment variables by name fragment regex, in priority
+# order: common variable names first, then generic fallbacks
+_VAR_DESCRIPTIONS: List[Tuple[str, str]] = [
+    ("port", "Application server port"),
+    ("host", "Server host address"),
+    ("database_url", "Database connection string"),
+    ("db_host", "Database host"),
+    ("db_port", "Database port"),
+    ("db_name", "Database name"),
+    ("db_user", "Database username"),
+    ("db_password", "Database password"),
+    ("redis_url", "Redis connection string"),
+    ("jwt_secret", "JWT signing secret"),
+    ("api_key", "External API key"),
+    ("secret_key", "Application secret key"),
+    ("debug", "Debug mode flag"),
+    ("env", "Environment (dev/staging/prod)"),
+    ("log_level", "Logging level"),
+    ("url|uri", "Service connection URL/URI"),
+    ("key|secret|token", "Authentication/encryption key"),
+    ("host|server", "Server/service host address"),
+    ("port", "Service port number"),
+]
+
+# All description fragments in one anchored regex. Alternatives are tried in
+# order, each anywhere in the name, so the first entry found anywhere wins
+# (not the leftmost match); the named group identifies the entry.
+_VAR_DESCRIPTION_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        f".*?(?P<d{i}>{pattern})" for i, (pattern, _) in enumerate(_VAR_DESCRIPTIONS)
+    )
+    + ")",
+    re.DOTALL,
+)
+
+# Markdown section headers (## or ###) counted in the JSON summary
+_SECTION_HEADER_RE = re.compile(r"^#{2,3}\s+", re.MULTILINE)
+
+# Substrings marking a variable name as holding a secret
+_SENSITIVE_PATTERNS: Tuple[str, ...] = ("password", "secret", "key", "token", "auth")
+
 
 class MarkdownFormatter:
     """Formats analysis results into markdown format."""
 
+    # time.strftime format for report timestamps
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
     def __init__(self):
         self.logger = get_logger(__name__)
 
-    def format_header(self, repo_name: str, results: Dict[str, Any]) -> str:
+    def format_header(
+        self, repo_name: str, results: Dict[str, Any], now_str: Optional[str] = None
+    ) -> str:
         """
         Format the report header with metadata.
 
         Args:
             repo_name: Repository name
             results: Analysis results
+            now_str: Formatted analysis time; the current time if not given
 
         Returns:
             Formatted header string
         """
-        header = f"# Technical Analysis: {repo_name}\n\n"
-        header += f"*Analysis Date: {time.strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+        if now_str is None:
+            now_str = time.strftime(self.TIMESTAMP_FORMAT)
+
+        parts: List[str] = [
+            f"# Technical Analysis: {repo_name}\n\n",
+            f"*Analysis Date: {now_str}*\n\n",
+        ]
 
         if results.get("Repository Path"):
-            header += f"*Repository Path: {results['Repository Path']}*\n\n"
+            parts.append(f"*Repository Path: {results['Repository Path']}*\n\n")
 
         if results.get("Files Analyzed"):
-            header += f"*Analysis Scope: {results['Files Analyzed']} files*\n\n"
+            parts.append(f"*Analysis Scope: {results['Files Analyzed']} files*\n\n")
 
         if results.get("Analysis Model"):
-            header += f"*AI Model: {results['Analysis Model']}*\n\n"
+            parts.append(f"*AI Model: {results['Analysis Model']}*\n\n")
 
-        return header
+        return "".join(parts)
 
     def format_git_section(self, git_info: Dict) -> str:
         """
@@ -53,38 +109,38 @@ class MarkdownFormatter:
             else:
                 return "## Git Repository Information\n\n❌ Not a Git repository\n\n"
 
-        git_section = "## Git Repository Information\n\n"
+        parts: List[str] = ["## Git Repository Information\n\n"]
 
         if git_info.get("repository_url"):
-            git_section += f"**Repository URL**: {git_info['repository_url']}\n\n"
+            parts.append(f"**Repository URL**: {git_info['repository_url']}\n\n")
 
         if git_info.get("current_branch"):
-            git_section += f"**Current Branch**: `{git_info['current_branch']}`\n\n"
+            parts.append(f"**Current Branch**: `{git_info['current_branch']}`\n\n")
 
         if git_info.get("all_branches"):
             branches = git_info["all_branches"]
-            git_section += (
+            parts.append(
                 f"**All Branches**: {', '.join(f'`{b}`' for b in branches[:10])}"
             )
             if len(branches) > 10:
-                git_section += f" (and {len(branches) - 10} more)"
-            git_section += "\n\n"
+                parts.append(f" (and {len(branches) - 10} more)")
+            parts.append("\n\n")
 
         if git_info.get("total_commits"):
-            git_section += f"**Total Commits**: {git_info['total_commits']}\n\n"
+            parts.append(f"**Total Commits**: {git_info['total_commits']}\n\n")
 
         if git_info.get("last_commit"):
             commit = git_info["last_commit"]
-            git_section += "### Last Commit\n\n"
-            git_section += f"- **Hash**: `{commit.get('hash', 'N/A')}`\n"
-            git_section += (
+            parts.append("### Last Commit\n\n")
+            parts.append(f"- **Hash**: `{commit.get('hash', 'N/A')}`\n")
+            parts.append(
                 f"- **Author**: {commit.get('author_name', 'N/A')} "
                 f"({commit.get('author_email', 'N/A')})\n"
             )
-            git_section += f"- **Date**: {commit.get('date', 'N/A')}\n"
-            git_section += f"- **Message**: {commit.get('message', 'N/A')}\n\n"
+            parts.append(f"- **Date**: {commit.get('date', 'N/A')}\n")
+            parts.append(f"- **Message**: {commit.get('message', 'N/A')}\n\n")
 
-        return git_section
+        return "".join(parts)
 
     def format_env_section(self, env_configs: Dict) -> str:
         """
@@ -99,11 +155,14 @@ class MarkdownFormatter:
         if not env_configs:
             return "## Environment Configuration Analysis\n\nNo environment configuration files found.\n\n"
 
-        env_section = "## Environment Configuration Analysis\n\n"
+        parts: List[str] = ["## Environment Configuration Analysis\n\n"]
         total_vars = sum(
             config.get("variable_count", 0) for config in env_configs.values()
         )
-        env_section += f"**Summary**: {len(env_configs)} environment files with {total_vars} total variables\n\n"
+        parts.append(
+            f"**Summary**: {len(env_configs)} environment files with "
+            f"{total_vars} total variables\n\n"
+        )
 
         for file_path, config in env_configs.items():
             variables = config.get("variables", {})
@@ -111,44 +170,57 @@ class MarkdownFormatter:
             total_lines = config.get("total_lines", 0)
             variable_count = config.get("variable_count", 0)
 
-            env_section += f"### {file_path}\n\n"
-            env_section += f"**File Stats**: {variable_count} variables, {total_lines} total lines\n\n"
+            parts.append(f"### {file_path}\n\n")
+            parts.append(
+                f"**File Stats**: {variable_count} variables, "
+                f"{total_lines} total lines\n\n"
+            )
 
             if comments:
-                env_section += "**Key Comments**:\n"
+                parts.append("**Key Comments**:\n")
                 for comment in comments[:5]:  # Show top 5 comments
-                    env_section += f"- {comment}\n"
-                env_section += "\n"
+                    parts.append(f"- {comment}\n")
+                parts.append("\n")
 
             if variables:
-                env_section += "| Variable | Purpose/Description | Example Value |\n"
-                env_section += "|----------|--------------------|--------------|\n"
-
-                # Sort variables for better organization
-                sorted_vars = sorted(variables.items())
-                for var_name, var_value in sorted_vars:
-                    description = self._get_var_description(var_name)
-                    display_value = self._mask_sensitive_value(var_name, var_value)
-                    env_section += (
-                        f"| `{var_name}` | {description} | `{display_value}` |\n"
+                parts.append("| Variable | Purpose/Description | Example Value |\n")
+                parts.append("|----------|--------------------|--------------|\n")
+
+                # Sort variables for better organization, rendering every row
+                # in one join
+                get_description = self._get_var_description
+                mask_value = self._mask_sensitive_value
+                parts.append(
+                    "\n".join(
+                        f"| `{var_name}` | {get_description(var_name)} | "
+                        f"`{mask_value(var_name, var_value)}` |"
+                        for var_name, var_value in sorted(
+                            variables.items(), key=itemgetter(0)
+                        )
                     )
-
-                env_section += "\n"
+                )
+                parts.append("\n\n")
             else:
-                env_section += "*No variables found (comments only)*\n\n"
+                parts.append("*No variables found (comments only)*\n\n")
 
-        return env_section
+        return "".join(parts)
 
-    def format_footer(self, results: Dict[str, Any]) -> str:
+    def format_footer(
+        self, results: Dict[str, Any], now_str: Optional[str] = None
+    ) -> str:
         """
         Format the report footer with analysis metadata.
 
         Args:
             results: Analysis results
+            now_str: Formatted generation time; the current time if not given
 
         Returns:
             Formatted footer string
         """
+        if now_str is None:
+            now_str = time.strftime(self.TIMESTAMP_FORMAT)
+
         footer = "\n\n---\n\n"
         footer += "*Analysis completed using AI-powered repository analysis*\n"
 
@@ -158,7 +230,7 @@ class MarkdownFormatter:
         if results.get("Files Analyzed"):
             footer += f"*Files processed: {results['Files Analyzed']}*\n"
 
-        footer += f"*Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        footer += f"*Generated: {now_str}*\n"
 
         return footer
 
@@ -188,13 +260,11 @@ class MarkdownFormatter:
         if not headers or not rows:
             return ""
 
-        table = "| " + " | ".join(headers) + " |\n"
-        table += "|" + "|".join(["-" * (len(h) + 2) for h in headers]) + "|\n"
-
-        for row in rows:
-            table += "| " + " | ".join(str(cell) for cell in row) + " |\n"
+        header_row = "| " + " | ".join(headers) + " |\n"
+        separator = "|" + "|".join(["-" * (len(h) + 2) for h in headers]) + "|\n"
+        body = "\n".join("| " + " | ".join(map(str, row)) + " |" for row in rows)
 
-        return table + "\n"
+        return header_row + separator + body + "\n\n"
 
     def format_list(self, items: list, ordered: bool = False) -> str:
         """
@@ -210,14 +280,10 @@ class MarkdownFormatter:
         if not items:
             return ""
 
-        list_str = ""
-        for i, item in enumerate(items):
-            if ordered:
-                list_str += f"{i + 1}. {item}\n"
-            else:
-                list_str += f"- {item}\n"
+        if ordered:
+            return "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1)) + "\n\n"
 
-        return list_str + "\n"
+        return "- " + "\n- ".join(map(str, items)) + "\n\n"
 
     def format_alert(self, message: str, alert_type: str = "info") -> str:
         """
@@ -235,49 +301,20 @@ class MarkdownFormatter:
         icon = icons.get(alert_type, "ℹ️")
         return f"> {icon} **{alert_type.title()}**: {message}\n\n"
 
-    def _get_var_description(self, var_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_var_description(var_name: str) -> str:
         """Get description for environment variable."""
-        var_lower = var_name.lower()
-
-        descriptions = {
-            "port": "Application server port",
-            "host": "Server host address",
-            "database_url": "Database connection string",
-            "db_host": "Database host",
-            "db_port": "Database port",
-            "db_name": "Database name",
-            "db_user": "Database username",
-            "db_password": "Database password",
-            "redis_url": "Redis connection string",
-            "jwt_secret": "JWT signing secret",
-            "api_key": "External API key",
-            "secret_key": "Application secret key",
-            "debug": "Debug mode flag",
-            "env": "Environment (dev/staging/prod)",
-            "log_level": "Logging level",
-        }
-
-        for key, desc in descriptions.items():
-            if key in var_lower:
-                return desc
-
-        if "url" in var_lower or "uri" in var_lower:
-            return "Service connection URL/URI"
-        elif "key" in var_lower or "secret" in var_lower or "token" in var_lower:
-            return "Authentication/encryption key"
-        elif "host" in var_lower or "server" in var_lower:
-            return "Server/service host address"
-        elif "port" in var_lower:
-            return "Service port number"
+        match = _VAR_DESCRIPTION_RE.match(var_name.lower())
+        # Every alternative is a named group, so a match always sets lastgroup
+        if match and match.lastgroup:
+            return _VAR_DESCRIPTIONS[int(match.lastgroup[1:])][1]
 
         return "Configuration parameter"
 
     def _mask_sensitive_value(self, var_name: str, var_value: str) -> str:
         """Mask sensitive values."""
-        var_lower = var_name.lower()
-        sensitive_patterns = ["password", "secret", "key", "token", "auth"]
-
-        if any(pattern in var_lower for pattern in sensitive_patterns):
+        if self._is_sensitive(var_name):
             if len(var_value) > 4:
                 return var_value[:2] + "*" * (len(var_value) - 4) + var_value[-2:]
             else:
@@ -285,6 +322,13 @@ class MarkdownFormatter:
 
         return var_value
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_sensitive(var_name: str) -> bool:
+        """Check whether a variable name looks like it holds a secret."""
+        var_lower = var_name.lower()
+        return any(pattern in var_lower for pattern in _SENSITIVE_PATTERNS)
+
 
 class JSONFormatter:
     """Formats analysis results into JSON format."""
@@ -304,31 +348,32 @@ class JSONFormatter:
         """
         from pathlib import Path
 
+        # Look up each result field once
+        repo_path = results.get("Repository Path", "")
+        git_info = results.get("Git Information") or {}
+        analysis = results.get("Repository Analysis") or ""
+
         summary = {
             "analysis_metadata": {
-                "timestamp": results.get("Timestamp", time.strftime("%Y%m%d_%H%M%S")),
+                "timestamp": (
+                    results["Timestamp"]
+                    if "Timestamp" in results
+                    else time.strftime("%Y%m%d_%H%M%S")
+                ),
                 "model_used": results.get("Analysis Model", "Unknown"),
                 "files_analyzed": results.get("Files Analyzed", 0),
-                "repository_path": results.get("Repository Path", ""),
+                "repository_path": repo_path,
             },
             "repository_info": {
-                "name": Path(results.get("Repository Path", "")).name
-                if results.get("Repository Path")
-                else "Unknown",
-                "git_info": results.get("Git Information", {}),
+                "name": Path(repo_path).name if repo_path else "Unknown",
+                "git_info": git_info,
                 "environment_files": len(results.get("Environment Configurations", {})),
-                "has_git_repo": results.get("Git Information", {}).get(
-                    "is_git_repo", False
-                ),
+                "has_git_repo": git_info.get("is_git_repo", False),
             },
             "analysis_summary": {
                 "has_analysis": "Repository Analysis" in results,
-                "analysis_length": len(results.get("Repository Analysis", ""))
-                if results.get("Repository Analysis")
-                else 0,
-                "sections_identified": self._count_sections(
-                    results.get("Repository Analysis", "")
-                ),
+                "analysis_length": len(analysis),
+                "sections_identified": self._count_sections(analysis),
             },
         }
 
@@ -339,8 +384,5 @@ class JSONFormatter:
         if not analysis_text:
             return 0
 
-        import re
-
-        # Count markdown headers (## or ###)
-        headers = re.findall(r"^#{2,3}\s+", analysis_text, re.MULTILINE)
-        return len(headers)
+        # Count markdown headers (## or ###) without building a list of them
+        return sum(1 for _ in _SECTION_HEADER_RE.finditer(analysis_text))
@@ -1,20 +1,55 @@
 # FilePath: src/repo_analyzer/output/report_generator.py
 
+import io
+import json
+import os
 import time
+import weakref
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from config.settings import Settings
 from ..utils.logging_utils import get_logger
 from .formatters import MarkdownFormatter
 
 
+def _close_log_handles(log_handles: Dict[Path, TextIO]) -> None:
+    """
+    Close open progress log files.
+
+    Also the finalizer for generators that were never closed explicitly, so
+    it must not reference the generator itself.
+
+    Args:
+        log_handles: Open progress log files by path
+    """
+    for handle in log_handles.values():
+        try:
+            handle.close()
+        except OSError:
+            pass
+    log_handles.clear()
+
+
 class ReportGenerator:
     """Handles generation and saving of analysis reports."""
 
+    # Progress log files kept open at once; the oldest is closed beyond this
+    MAX_OPEN_LOGS = 8
+
     def __init__(self):
         self.logger = get_logger(__name__)
         self.formatter = MarkdownFormatter()
+        # Progress log files stay open between entries instead of being
+        # reopened for every append
+        self._log_handles: Dict[Path, TextIO] = {}
+        self._finalizer = weakref.finalize(self, _close_log_handles, self._log_handles)
 
     def save_analysis(
         self, results: Dict[str, Any], repo_path: str, timestamp: str
@@ -41,17 +76,15 @@ class ReportGenerator:
             timestamped_file = output_dir / f"{timestamp}_{repo_name}_analysis.md"
             latest_file = output_dir / f"{repo_name}_latest.md"
 
-            # Generate report content
-            content = self._generate_report_content(results, repo_path, timestamp)
+            # Generate and encode report content once; the two files differ
+            # only in their filepath comment
+            body = self._generate_report_body(results, repo_name).encode("utf-8")
 
             # Save timestamped version
-            with open(timestamped_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            self._write_report(timestamped_file, body)
 
             # Save latest version (without timestamp in filename)
-            latest_content = self._generate_latest_content(content)
-            with open(latest_file, "w", encoding="utf-8") as f:
-                f.write(latest_content)
+            self._write_report(latest_file, body)
 
             self.logger.info(f"Analysis saved to: {timestamped_file}")
             self.logger.info(f"Latest version: {latest_file}")
@@ -79,72 +112,82 @@ class ReportGenerator:
         """
         try:
             output_dir = Settings.get_output_dir(repo_name)
-            output_dir.mkdir(parents=True, exist_ok=True)
-
             log_file = output_dir / f"{timestamp}_{repo_name}_{log_type}.md"
 
-            # Initialize log file if it doesn't exist
-            if not log_file.exists():
-                header = f"# FilePath: {timestamp}_{repo_name}_{log_type}.md\n\n"
-                header += f"# {log_type.title()} Log: {repo_name}\n\n"
-                with open(log_file, "w", encoding="utf-8") as f:
-                    f.write(header)
+            handle = self._log_handles.get(log_file)
+            if handle is None:
+                handle = self._open_progress_log(log_file, repo_name, log_type)
 
-            # Append log entry
+            # Append log entry, flushed so the log can be followed live
             log_timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            log_entry = f"\n## {log_timestamp}\n\n{content}\n\n---\n\n"
-
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(log_entry)
+            handle.write(f"\n## {log_timestamp}\n\n{content}\n\n---\n\n")
+            handle.flush()
 
         except Exception as e:
             self.logger.warning(f"Failed to save progress log: {str(e)}")
 
-    def _generate_report_content(
-        self, results: Dict[str, Any], repo_path: str, timestamp: str
-    ) -> str:
-        """Generate the complete report content."""
-        repo_name = Path(repo_path).name
+    def close(self) -> None:
+        """Close progress log files kept open by save_progress_log."""
+        _close_log_handles(self._log_handles)
+
+    def __enter__(self):
+        return self
 
-        content = f"# FilePath: {timestamp}_{repo_name}_analysis.md\n\n"
-        content += self.formatter.format_header(repo_name, results)
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_progress_log(
+        self, log_file: Path, repo_name: str, log_type: str
+    ) -> TextIO:
+        """Open a progress log for appending, writing its header if it is new."""
+        if len(self._log_handles) >= self.MAX_OPEN_LOGS:
+            oldest = next(iter(self._log_handles))
+            self._log_handles.pop(oldest).close()
+
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(log_file, "a", encoding="utf-8")
+
+        # Initialize log file if it is empty
+        if handle.tell() == 0:
+            handle.write(f"# FilePath: {log_file.name}\n\n")
+            handle.write(f"# {log_type.title()} Log: {repo_name}\n\n")
+
+        self._log_handles[log_file] = handle
+        return handle
+
+    def _generate_report_body(self, results: Dict[str, Any], repo_name: str) -> str:
+        """Generate the report content that follows the filepath comment."""
+        # Format the current time once for both the header and the footer
+        now_str = time.strftime(MarkdownFormatter.TIMESTAMP_FORMAT)
+
+        buf = io.StringIO()
+        buf.write(self.formatter.format_header(repo_name, results, now_str))
 
         # Add Git information if available
         if results.get("Git Information"):
-            content += self.formatter.format_git_section(results["Git Information"])
+            buf.write(self.formatter.format_git_section(results["Git Information"]))
 
         # Add environment configuration if available
         if results.get("Environment Configurations"):
-            content += self.formatter.format_env_section(
-                results["Environment Configurations"]
+            buf.write(
+                self.formatter.format_env_section(results["Environment Configurations"])
             )
 
         # Add main analysis
-        content += results.get("Repository Analysis", "Analysis not available")
+        buf.write(results.get("Repository Analysis", "Analysis not available"))
 
         # Add footer
-        content += self.formatter.format_footer(results)
+        buf.write(self.formatter.format_footer(results, now_str))
 
-        return content
+        return buf.getvalue()
 
-    def _generate_latest_content(self, content: str) -> str:
-        """Generate content for the latest file (without timestamp in filepath)."""
-        # Extract content after the filepath comment
-        lines = content.split("\n")
-        start_index = 0
-
-        for i, line in enumerate(lines):
-            if line.startswith("# Technical Analysis:"):
-                start_index = i
-                break
-
-        if start_index > 0:
-            # Add new filepath comment
-            latest_content = "# FilePath: {repo_name}_latest.md\n\n"
-            latest_content += "\n".join(lines[start_index:])
-            return latest_content
-
-        return content
+    def _write_report(self, file_path: Path, body: bytes) -> None:
+        """Write a report file, headed by a filepath comment naming it."""
+        # The body is already encoded, so write in binary mode and skip the
+        # text layer's per-file encoding
+        with open(file_path, "wb") as f:
+            f.write(f"# FilePath: {file_path.name}\n\n".encode("utf-8"))
+            f.write(body)
 
     def _save_additional_formats(
         self, results: Dict[str, Any], output_dir: Path, repo_name: str, timestamp: str
@@ -152,29 +195,32 @@ class ReportGenerator:
         """Save analysis in additional formats if requested."""
         try:
             # Save JSON summary for programmatic access
+            git_info = results.get("Git Information") or {}
             summary = {
                 "repository_name": repo_name,
                 "analysis_timestamp": timestamp,
                 "files_analyzed": results.get("Files Analyzed", 0),
                 "model_used": results.get("Analysis Model", "Unknown"),
-                "git_info": results.get("Git Information", {}),
+                "git_info": git_info,
                 "env_files_count": len(results.get("Environment Configurations", {})),
-                "has_git_repo": results.get("Git Information", {}).get(
-                    "is_git_repo", False
-                ),
-                "repository_url": results.get("Git Information", {}).get(
-                    "repository_url"
-                ),
-                "current_branch": results.get("Git Information", {}).get(
-                    "current_branch"
-                ),
+                "has_git_repo": git_info.get("is_git_repo", False),
+                "repository_url": git_info.get("repository_url"),
+                "current_branch": git_info.get("current_branch"),
             }
 
             json_file = output_dir / f"{timestamp}_{repo_name}_summary.json"
-            import json
 
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2, default=str)
+            if orjson is not None:
+                json_file.write_bytes(
+                    orjson.dumps(
+                        summary,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        default=str,
+                    )
+                )
+            else:
+                with open(json_file, "w", encoding="utf-8") as f:
+                    json.dump(summary, f, indent=2, default=str)
 
             self.logger.debug(f"Saved JSON summary: {json_file}")
 
@@ -196,25 +242,32 @@ class ReportGenerator:
             if not output_dir.exists():
                 return []
 
+            # A literal suffix match also keeps glob metacharacters in the
+            # repository name from being treated as a pattern
+            suffix = f"_{repo_name}_analysis.md"
             analysis_files = []
-            for file_path in output_dir.glob(f"*_{repo_name}_analysis.md"):
-                try:
-                    stat = file_path.stat()
-                    timestamp_str = file_path.stem.split("_")[0]
-
-                    analysis_files.append(
-                        {
-                            "file_path": str(file_path),
-                            "timestamp": timestamp_str,
-                            "size": stat.st_size,
-                            "modified": stat.st_mtime,
-                        }
-                    )
-                except Exception:
-                    continue
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(suffix):
+                        continue
+
+                    try:
+                        stat = entry.stat()
+                        timestamp_str = entry.name.split("_")[0]
+
+                        analysis_files.append(
+                            {
+                                "file_path": entry.path,
+                                "timestamp": timestamp_str,
+                                "size": stat.st_size,
+                                "modified": stat.st_mtime,
+                            }
+                        )
+                    except Exception:
+                        continue
 
             # Sort by timestamp (newest first)
-            analysis_files.sort(key=lambda x: x["timestamp"], reverse=True)
+            analysis_files.sort(key=itemgetter("timestamp"), reverse=True)
             return analysis_files
 
         except Exception as e:
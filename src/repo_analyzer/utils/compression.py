@@ -1,15 +1,131 @@
 # FilePath: src/repo_analyzer/utils/compression.py
 
+import re
+from itertools import groupby
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Tuple
 
 from config.settings import Settings
 from .logging_utils import get_logger
 
 
+def _compile_substring_matcher(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile literal substrings into one regex that finds any of them.
+
+    Patterns containing another pattern are dropped, as they can never
+    decide a match, and the rest are grouped by first character so the
+    regex engine tests only the alternatives that can start at a position.
+
+    Args:
+        patterns: Literal substrings to look for
+
+    Returns:
+        Compiled regex matching wherever any pattern occurs
+    """
+    unique = set(patterns)
+    needed = sorted(p for p in unique if not any(q != p and q in p for q in unique))
+
+    groups = []
+    for first_char, bucket in groupby(needed, key=lambda p: p[0]):
+        rests = [p[1:] for p in bucket]
+        if "" in rests:
+            groups.append(re.escape(first_char))
+        else:
+            groups.append(
+                re.escape(first_char) + "(?:" + "|".join(map(re.escape, rests)) + ")"
+            )
+
+    return re.compile("|".join(groups))
+
+
 class SmartCompressor:
     """Intelligently compress code while preserving structure and context."""
 
+    # Substrings marking a line to keep regardless of indentation
+    IMPORTANT_PATTERNS: Tuple[str, ...] = (
+        # Imports and exports
+        "import ",
+        "from ",
+        "export ",
+        "require(",
+        "include ",
+        # Function/class definitions
+        "def ",
+        "class ",
+        "function ",
+        "async def",
+        "fn ",
+        "pub fn",
+        "interface ",
+        "trait ",
+        "impl ",
+        "struct ",
+        "enum ",
+        # Type definitions
+        "type ",
+        "typedef ",
+        "using ",
+        "@interface",
+        "protocol ",
+        # Decorators and annotations
+        "@",
+        "#[",
+        "/*",
+        "//",
+        "#",
+        # Important keywords
+        "return ",
+        "yield ",
+        "throw ",
+        "raise ",
+        "panic!",
+        # Route definitions and endpoints
+        "app.",
+        "router.",
+        "@app.route",
+        "@router.",
+        "app.use",
+        # Database and model definitions
+        "CREATE TABLE",
+        "ALTER TABLE",
+        "SELECT ",
+        "INSERT ",
+        "UPDATE ",
+        # Configuration and constants
+        "const ",
+        "let ",
+        "var ",
+        "final ",
+        "static ",
+        # Package and module info
+        "package ",
+        "module ",
+        "namespace ",
+        # Error handling
+        "try ",
+        "catch ",
+        "except ",
+        "finally ",
+        "rescue ",
+        # Control flow
+        "if ",
+        "else ",
+        "elif ",
+        "while ",
+        "for ",
+        "switch ",
+        "case ",
+        # Async/await patterns
+        "async ",
+        "await ",
+        "Promise",
+        "Future",
+    )
+
+    # All important patterns in one regex, so a line is scanned once
+    _IMPORTANT_RE = _compile_substring_matcher(IMPORTANT_PATTERNS)
+
     def __init__(self):
         self.logger = get_logger(__name__)
 
@@ -27,65 +143,73 @@ class SmartCompressor:
         if not Settings.USE_SMART_COMPRESSION:
             return content
 
+        # Small files have too little nesting for compression to pay off
+        if (
+            len(content) < Settings.SMART_COMPRESSION_MIN_BYTES
+            or content.count("\n") < Settings.SMART_COMPRESSION_MIN_LINES
+        ):
+            return content
+
         lines = content.split("\n")
-        compressed_lines = []
+        compressed_lines: List[str] = []
 
         # Detect indentation style
         indentation_char, indent_size = self._detect_indentation(lines)
 
         consecutive_blank_lines = 0
         in_string_block = False
-        string_delimiters = ['"""', "'''"]
+        # Length of compressed_lines just after the last compression marker
+        # and just after the last non-blank line
+        marker_end = -3
+        content_end = 0
+
+        # Bind hot lookups to locals outside the per-line loop
+        max_indent_level = Settings.MAX_INDENTATION_LEVEL
+        is_important_line = self._is_important_line
+        append = compressed_lines.append
+        base_indent = indentation_char * (max_indent_level * indent_size)
+        compressed_marker = f"{base_indent}// ... [compressed: deeply nested code] ..."
+        # A line is nested deeper than the maximum level exactly when it
+        # starts with this much indentation, so one startswith call replaces
+        # counting the leading whitespace
+        too_deep_prefix = indentation_char * ((max_indent_level + 1) * indent_size)
 
         for i, line in enumerate(lines):
-            stripped_line = line.strip()
-
-            # Track multiline strings to preserve them
-            for delimiter in string_delimiters:
-                if delimiter in line:
-                    in_string_block = not in_string_block
+            # Track multiline strings to preserve them: an odd number of
+            # delimiters on a line opens or closes a block. Most lines have no
+            # quotes at all, so check for a quote before counting.
+            if ('"' in line or "'" in line) and (
+                line.count('"""') + line.count("'''")
+            ) & 1:
+                in_string_block = not in_string_block
 
             # Skip completely empty lines (but allow one consecutive blank line)
-            if not stripped_line:
+            if not line or line.isspace():
                 consecutive_blank_lines += 1
                 if consecutive_blank_lines <= 1:
-                    compressed_lines.append("")
+                    append("")
                 continue
             else:
                 consecutive_blank_lines = 0
 
-            # Calculate indentation level
-            indent_level = self._calculate_indent_level(
-                line, indentation_char, indent_size
-            )
-
-            # Always keep certain types of lines regardless of indentation
-            is_important = self._is_important_line(line)
-
-            # Keep line if it's important OR within acceptable indentation level
+            # Keep line if it's within acceptable indentation level, inside a
+            # multiline string, or important (checked last, as the costliest)
             if (
-                is_important
-                or indent_level <= Settings.MAX_INDENTATION_LEVEL
-                or in_string_block
+                in_string_block
+                or not line.startswith(too_deep_prefix)
+                or is_important_line(line)
             ):
-                compressed_lines.append(line)
+                append(line)
+                content_end = len(compressed_lines)
             else:
                 # For deeply nested code, add a comment indicating compression
-                if i > 0 and not any(
-                    "..." in prev_line for prev_line in compressed_lines[-3:]
-                ):
-                    base_indent = indentation_char * (
-                        Settings.MAX_INDENTATION_LEVEL * indent_size
-                    )
-                    compressed_lines.append(
-                        f"{base_indent}// ... [compressed: deeply nested code] ..."
-                    )
-
-        # Remove trailing empty lines
-        while compressed_lines and not compressed_lines[-1].strip():
-            compressed_lines.pop()
-
-        compressed_content = "\n".join(compressed_lines)
+                # unless one is among the last three output lines
+                if i > 0 and len(compressed_lines) - marker_end >= 3:
+                    append(compressed_marker)
+                    marker_end = content_end = len(compressed_lines)
+
+        # Drop trailing empty lines
+        compressed_content = "\n".join(compressed_lines[:content_end])
 
         # Calculate and log compression ratio
         self._log_compression_stats(content, compressed_content, file_path)
@@ -126,25 +250,6 @@ class SmartCompressor:
 
         return indentation_char, indent_size
 
-    def _calculate_indent_level(
-        self, line: str, indentation_char: str, indent_size: int
-    ) -> int:
-        """
-        Calculate the indentation level of a line.
-
-        Args:
-            line: Line to analyze
-            indentation_char: Character used for indentation
-            indent_size: Size of one indentation level
-
-        Returns:
-            Indentation level
-        """
-        if indentation_char == "\t":
-            return len(line) - len(line.lstrip("\t"))
-        else:
-            return (len(line) - len(line.lstrip(" "))) // indent_size
-
     def _is_important_line(self, line: str) -> bool:
         """
         Check if a line should be preserved regardless of indentation.
@@ -155,87 +260,7 @@ class SmartCompressor:
         Returns:
             True if the line is important
         """
-        important_patterns = [
-            # Imports and exports
-            "import ",
-            "from ",
-            "export ",
-            "require(",
-            "include ",
-            # Function/class definitions
-            "def ",
-            "class ",
-            "function ",
-            "async def",
-            "fn ",
-            "pub fn",
-            "interface ",
-            "trait ",
-            "impl ",
-            "struct ",
-            "enum ",
-            # Type definitions
-            "type ",
-            "typedef ",
-            "using ",
-            "@interface",
-            "protocol ",
-            # Decorators and annotations
-            "@",
-            "#[",
-            "/*",
-            "//",
-            "#",
-            # Important keywords
-            "return ",
-            "yield ",
-            "throw ",
-            "raise ",
-            "panic!",
-            # Route definitions and endpoints
-            "app.",
-            "router.",
-            "@app.route",
-            "@router.",
-            "app.use",
-            # Database and model definitions
-            "CREATE TABLE",
-            "ALTER TABLE",
-            "SELECT ",
-            "INSERT ",
-            "UPDATE ",
-            # Configuration and constants
-            "const ",
-            "let ",
-            "var ",
-            "final ",
-            "static ",
-            # Package and module info
-            "package ",
-            "module ",
-            "namespace ",
-            # Error handling
-            "try ",
-            "catch ",
-            "except ",
-            "finally ",
-            "rescue ",
-            # Control flow
-            "if ",
-            "else ",
-            "elif ",
-            "while ",
-            "for ",
-            "switch ",
-            "case ",
-            # Async/await patterns
-            "async ",
-            "await ",
-            "Promise",
-            "Future",
-        ]
-
-        return any(pattern in line for pattern in important_patterns)
+        return self._IMPORTANT_RE.search(line) is not None
 
     def _log_compression_stats(
         self, original: str, compressed: str, file_path: Path
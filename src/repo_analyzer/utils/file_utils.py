@@ -0,0 +1,90 @@
+# FilePath: src/repo_analyzer/utils/file_utils.py
+
+import os
+from pathlib import Path
+from typing import Union
+
+# Buffer size for whole-file reads (fewer read() syscalls than the 8 KiB default)
+READ_BUFFER_SIZE = 128 * 1024
+
+# Leading bytes checked for NUL when sniffing for binary content
+BINARY_SNIFF_SIZE = 4096
+
+
+def read_text_file(file_path: Path) -> str:
+    """
+    Read a UTF-8 text file using binary I/O and a single decode.
+
+    Skips the TextIOWrapper decoding layer; newlines are normalized to
+    "\\n" the same way text-mode reads do.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Decoded file content
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        data = f.read()
+
+    return decode_text(data)
+
+
+def decode_text(data: bytes) -> str:
+    """
+    Decode UTF-8 bytes read in binary mode into text.
+
+    Args:
+        data: Raw file bytes
+
+    Returns:
+        Decoded text with universal newlines applied
+
+    Raises:
+        UnicodeDecodeError: If the data is not valid UTF-8
+    """
+    content = data.decode("utf-8")
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    return content
+
+
+def root_prefix(root: Union[str, Path]) -> str:
+    """
+    Get the string prefix shared by paths discovered beneath a root directory.
+
+    Args:
+        root: Root directory the paths were built from
+
+    Returns:
+        Root path string ending in a path separator
+    """
+    root_str = os.fspath(root)
+    return root_str if root_str.endswith(os.sep) else root_str + os.sep
+
+
+def relative_path(path: Union[str, Path], prefix: str) -> str:
+    """
+    Get a path relative to its root by slicing off the root prefix.
+
+    Much cheaper than Path.relative_to, which splits and compares every
+    component. Paths that do not start with the prefix (e.g. ones normalized
+    by pathlib) fall back to Path.relative_to.
+
+    Args:
+        path: Path found beneath the root
+        prefix: Root prefix from root_prefix()
+
+    Returns:
+        Relative path string
+    """
+    path_str = os.fspath(path)
+    if path_str.startswith(prefix):
+        return path_str[len(prefix) :]
+
+    return str(Path(path_str).relative_to(prefix))
@@ -1,63 +1,281 @@
 # FilePath: src/repo_analyzer/utils/logging_utils.py
 
+import atexit
+import collections
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Deque, List, Optional, Tuple
 
 # from config.settings import Settings
 # Diagnostic Message: "Settings" is not accessed | Code: No code | Source: Pyright | Reference: No documentation
 
 
-def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> None:
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers writes instead of flushing every record.
+
+    Records accumulate in a large write buffer and reach the file in big
+    writes. Records at FLUSH_LEVEL or above are flushed at once so problems
+    show up in the file immediately; the rest is flushed on close, which
+    logging.shutdown() does at interpreter exit. With sync=True those
+    immediate flushes are also fsync'ed, so they survive a crash.
+    """
+
+    # Size of the file's write buffer in bytes
+    BUFFER_SIZE = 64 * 1024
+
+    # Records at or above this level are flushed immediately
+    FLUSH_LEVEL = logging.WARNING
+
+    def __init__(self, *args, sync: bool = False, **kwargs):
+        # Set first: FileHandler opens the file unless delay=True
+        self.sync = sync
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=getattr(self, "errors", None),
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only records at or above FLUSH_LEVEL."""
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.FLUSH_LEVEL:
+                self.stream.flush()
+                if self.sync:
+                    os.fsync(self.stream.fileno())
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats each second's timestamp only once.
+
+    With a datefmt that has no sub-second fields, every record logged within
+    the same second gets the same asctime, so the last result is reused
+    instead of calling time.strftime for each record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_str = self._cached_time
+        if second != cached_second:
+            cached_str = time.strftime(datefmt, self.converter(record.created))
+            self._cached_time = (second, cached_str)
+
+        return cached_str
+
+
+class LineFormatter(CachedTimeFormatter):
+    """
+    Formatter specialized for the "time - name - level - message" line layout.
+
+    The layout is fixed, so each line is built with a single f-string instead
+    of the generic %(...)s substitution of logging.Formatter.
+    """
+
+    FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self):
+        super().__init__(self.FORMAT, datefmt=self.DATE_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
+        # Exception and stack text are appended as in logging.Formatter.format
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+
+        return s
+
+
+class _NoiseFilter(logging.Filter):
+    """Drop records below WARNING from chatty third-party libraries."""
+
+    # Top-level logger names of the filtered libraries
+    NOISY_LOGGERS = frozenset({"anthropic", "httpx", "urllib3"})
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return (
+            record.levelno >= logging.WARNING
+            or record.name.partition(".")[0] not in self.NOISY_LOGGERS
+        )
+
+
+# Background thread writing queued records to the configured handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# (level, log file, sync) of the active setup_logging configuration
+_config_key: Optional[Tuple[int, Optional[str], bool]] = None
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, writing out any records still queued."""
+    global _listener
+
+    if _listener is not None:
+        _close_listener(_listener)
+        _listener = None
+
+
+def _close_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a queue listener once its queue is drained and close its handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Registered after the logging module's own shutdown hook, so it runs first
+# and the handlers are still open while the queue drains
+atexit.register(_stop_listener)
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_file: Optional[Path] = None,
+    sync: Optional[bool] = None,
+) -> None:
     """
     Setup logging configuration for the application.
 
+    Loggers only enqueue records; a background QueueListener formats them
+    and does the console and file I/O, so logging never blocks on output.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file path for logging output
+        sync: Whether to fsync the log file after each WARNING or higher
+            record, so it survives a crash at the cost of a disk sync per
+            flushed record. Defaults to syncing only at DEBUG level
     """
+    global _config_key
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    if sync is None:
+        sync = numeric_level == logging.DEBUG
+
+    # Repeated calls with the same configuration keep the running setup
+    config_key = (numeric_level, str(log_file) if log_file else None, sync)
+    if config_key == _config_key:
+        return
 
     # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = LineFormatter()
 
     # Setup console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-
-    # Setup root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
-    root_logger.handlers.clear()  # Clear any existing handlers
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     # Setup file handler if specified
+    file_error = None
     if log_file:
         try:
             log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
+            file_handler = BufferedFileHandler(log_file, sync=sync)
             file_handler.setLevel(numeric_level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
-            root_logger.warning(f"Failed to setup file logging: {e}")
+            file_error = e
+
+    # Hand the handlers to a fresh listener
+    global _listener
+    previous_listener = _listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+    # Setup root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    _clear_root_handlers(root_logger)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Filtered before enqueueing, so dropped records are never formatted
+    queue_handler.addFilter(_NoiseFilter())
+    root_logger.addHandler(queue_handler)
+
+    # New records now go to the fresh queue; drain and close the old setup
+    if previous_listener is not None:
+        _close_listener(previous_listener)
+
+    if file_error is not None:
+        root_logger.warning(f"Failed to setup file logging: {file_error}")
+
+    # A failed file setup is retried by the next call
+    _config_key = config_key if file_error is None else None
+
+
+def reset_logging() -> None:
+    """
+    Undo setup_logging, stopping the queue listener and closing all handlers.
+
+    The next setup_logging call then configures logging from scratch, even
+    with the same parameters (e.g. between tests).
+    """
+    global _config_key
+
+    _clear_root_handlers(logging.getLogger())
+    _stop_listener()
+    _config_key = None
 
-    # Reduce noise from external libraries
-    logging.getLogger("anthropic").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+def _clear_root_handlers(root_logger: logging.Logger) -> None:
+    """Close and remove the root logger's handlers."""
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
 
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
 
+    Loggers live for the life of the process, so each name is looked up in
+    the logging manager (under its lock) only once.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -70,31 +288,89 @@ def get_logger(name: str) -> logging.Logger:
 class ProgressLogger:
     """Logger for tracking analysis progress."""
 
-    def __init__(self, total_steps: int, description: str = "Processing"):
+    # Most progress lines held between batched emits (oldest are dropped)
+    BUFFER_SIZE = 1024
+
+    # Seconds after which buffered progress lines are emitted regardless
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(
+        self, total_steps: int, description: str = "Processing", batch_size: int = 1
+    ):
+        """
+        Initialize the progress logger.
+
+        Args:
+            total_steps: Number of steps expected
+            description: Label prefixed to every progress line
+            batch_size: Steps whose progress lines are emitted together in a
+                single record; 1 logs every step as it happens
+        """
         self.total_steps = total_steps
         self.current_step = 0
         self.description = description
+        self.batch_size = batch_size
         self.logger = get_logger(__name__)
+        # Per-step percentage and message prefix, computed once
+        self._percent_per_step = 100.0 / total_steps if total_steps else 0.0
+        self._prefix = f"{description}: "
+        self._buffer: Deque[str] = collections.deque(maxlen=self.BUFFER_SIZE)
+        self._last_emit = time.monotonic()
 
     def step(self, message: str = "") -> None:
         """Advance progress by one step."""
         self.current_step += 1
-        progress = (self.current_step / self.total_steps) * 100
 
-        log_message = f"{self.description}: {self.current_step}/{self.total_steps} ({progress:.1f}%)"
-        if message:
-            log_message += f" - {message}"
+        # Skip building the message when INFO records are filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        progress = self.current_step * self._percent_per_step
+        suffix = f" - {message}" if message else ""
+
+        line = (
+            f"{self._prefix}{self.current_step}/{self.total_steps} "
+            f"({progress:.1f}%){suffix}"
+        )
 
-        self.logger.info(log_message)
+        if self.batch_size <= 1:
+            self.logger.info(line)
+            return
+
+        self._buffer.append(line)
+        now = time.monotonic()
+        if (
+            self.current_step % self.batch_size == 0
+            or now - self._last_emit > self.FLUSH_INTERVAL
+        ):
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """
+        Emit buffered progress lines as a single log record.
+
+        Args:
+            now: Current time.monotonic() value, if already known
+        """
+        if self._buffer:
+            self.logger.info("\n".join(self._buffer))
+            self._buffer.clear()
+
+        self._last_emit = time.monotonic() if now is None else now
 
     def finish(self, message: str = "Complete") -> None:
         """Mark progress as finished."""
+        self.flush()
         self.logger.info(f"{self.description}: {message}")
 
 
 class AnalysisLogger:
     """Specialized logger for analysis operations."""
 
+    # Most chunk progress lines logged at INFO level per analysis; the rest
+    # are logged at DEBUG level
+    CHUNK_PROGRESS_LINES = 50
+
     def __init__(self, repo_name: str):
         self.repo_name = repo_name
         self.logger = get_logger(f"analyzer.{repo_name}")
@@ -102,19 +378,31 @@ class AnalysisLogger:
 
     def start_analysis(self, total_files: int) -> None:
         """Log the start of analysis."""
-        import time
-
-        self.start_time = time.time()
+        # Monotonic, so durations are unaffected by wall-clock adjustments
+        self.start_time = time.monotonic()
         self.logger.info(f"Starting analysis of {self.repo_name} ({total_files} files)")
 
     def log_chunk_progress(
         self, chunk_num: int, total_chunks: int, files_in_chunk: int
     ) -> None:
         """Log progress for chunk processing."""
-        progress = (chunk_num / total_chunks) * 100
-        self.logger.info(
-            f"Processing chunk {chunk_num}/{total_chunks} ({progress:.1f}%) - "
-            f"{files_in_chunk} files"
+        # Only every stride-th chunk and the last one are reported at INFO
+        stride = max(1, total_chunks // self.CHUNK_PROGRESS_LINES)
+        if chunk_num == total_chunks or chunk_num % stride == 0:
+            level = logging.INFO
+        else:
+            level = logging.DEBUG
+
+        if not self.logger.isEnabledFor(level):
+            return
+
+        self.logger.log(
+            level,
+            "Processing chunk %d/%d (%.1f%%) - %d files",
+            chunk_num,
+            total_chunks,
+            (chunk_num / total_chunks) * 100,
+            files_in_chunk,
         )
 
     def log_section_progress(self, section_num: int, section_name: str) -> None:
@@ -123,10 +411,8 @@ class AnalysisLogger:
 
     def finish_analysis(self, output_file: Optional[str] = None) -> None:
         """Log the completion of analysis."""
-        import time
-
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.start_time is not None:
+            duration = time.monotonic() - self.start_time
             self.logger.info(
                 f"Analysis of {self.repo_name} completed in {duration:.1f} seconds"
             )
@@ -138,9 +424,12 @@ class AnalysisLogger:
 
     def log_error(self, error: Exception, context: str = "") -> None:
         """Log an error with context."""
-        error_msg = f"Error in {self.repo_name} analysis"
-        if context:
-            error_msg += f" ({context})"
-        error_msg += f": {str(error)}"
-
-        self.logger.error(error_msg, exc_info=True)
+        # Lazy %-args defer building the message to the handler; passing the
+        # exception itself attaches its traceback without a sys.exc_info() call
+        self.logger.error(
+            "Error in %s analysis%s: %s",
+            self.repo_name,
+            f" ({context})" if context else "",
+            error,
+            exc_info=error,
+        )
@@ -1,25 +1,17 @@
 # FilePath: test/test_analyzer.py
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from repo_analyzer.core.analyzer import RepositoryAnalyzer
 from repo_analyzer.llm.factory import LLMFactory
 
-
-class TestRepositoryAnalyzer:
-    """Test cases for RepositoryAnalyzer."""
-
-    @pytest.fixture
-    def temp_repo(self):
-        """Create a temporary repository for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
-
-        # Create some test files
-        (temp_dir / "main.py").write_text("""
+# Files of the repository used by TestRepositoryAnalyzer, pre-encoded
+_ANALYZER_REPO_FILES = (
+    (
+        "main.py",
+        b"""
 # FilePath: main.py
 
 def hello_world():
@@ -27,107 +19,124 @@ def hello_world():
 
 if __name__ == "__main__":
     hello_world()
-""")
-
-        (temp_dir / "requirements.txt").write_text("""
+""",
+    ),
+    (
+        "requirements.txt",
+        b"""
 # FilePath: requirements.txt
 
 flask==2.0.1
 requests==2.25.1
-""")
-
-        (temp_dir / ".env.example").write_text("""
+""",
+    ),
+    (
+        ".env.example",
+        b"""
 # FilePath: .env.example
 
 DATABASE_URL=postgresql://localhost/myapp
 SECRET_KEY=your_secret_key_here
 DEBUG=True
-""")
+""",
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def analyzer_repo(tmp_path_factory):
+    """Create a temporary repository for testing, once per session."""
+    temp_dir = tmp_path_factory.mktemp("repo")
 
-        yield temp_dir
+    # Create some test files
+    for name, content in _ANALYZER_REPO_FILES:
+        (temp_dir / name).write_bytes(content)
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
+    return temp_dir
 
-    def test_analyzer_initialization(self):
+
+@pytest.fixture(scope="class")
+def analyzer():
+    """Create one analyzer shared by every test in a class."""
+    with patch("config.settings.Settings.ANTHROPIC_API_KEY", "test_key"):
+        yield RepositoryAnalyzer(llm_provider="claude")
+
+
+class TestRepositoryAnalyzer:
+    """Test cases for RepositoryAnalyzer."""
+
+    def test_analyzer_initialization(self, analyzer):
         """Test analyzer initialization."""
-        with patch("config.settings.Settings.ANTHROPIC_API_KEY", "test_key"):
-            analyzer = RepositoryAnalyzer(llm_provider="claude")
-            assert analyzer.llm_provider == "claude"
-            assert analyzer.model is not None
+        assert analyzer.llm_provider == "claude"
+        assert analyzer.model is not None
 
-    def test_get_repository_overview(self, temp_repo):
+    def test_get_repository_overview(self, analyzer, analyzer_repo):
         """Test getting repository overview."""
-        with patch("config.settings.Settings.ANTHROPIC_API_KEY", "test_key"):
-            analyzer = RepositoryAnalyzer(llm_provider="claude")
-
-            overview = analyzer.get_repository_overview(str(temp_repo))
+        overview = analyzer.get_repository_overview(str(analyzer_repo))
 
-            assert overview["name"] == temp_repo.name
-            assert overview["file_count"] > 0
-            assert "path" in overview
+        assert overview["name"] == analyzer_repo.name
+        assert overview["file_count"] > 0
+        assert "path" in overview
 
     @patch("repo_analyzer.llm.claude.ClaudeProvider.generate_response")
-    def test_analyze_chunk_independently(self, mock_generate, temp_repo):
+    def test_analyze_chunk_independently(self, mock_generate, analyzer):
         """Test independent chunk analysis."""
         mock_generate.return_value = "Test analysis result"
 
-        with patch("config.settings.Settings.ANTHROPIC_API_KEY", "test_key"):
-            analyzer = RepositoryAnalyzer(llm_provider="claude")
-
-            result = analyzer._analyze_chunk_independently(
-                "test_repo", "test content", 1, 1
-            )
+        result = analyzer._analyze_chunk_independently(
+            "test_repo", "test content", 1, 1
+        )
 
-            assert result == "Test analysis result"
-            mock_generate.assert_called_once()
+        assert result == "Test analysis result"
+        mock_generate.assert_called_once()
 
 
 # FilePath: tests/test_file_processor.py
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 
 from repo_analyzer.core.file_processor import FileProcessor
 from config.languages import LanguageConfig
 
+# Files of the repository used by TestFileProcessor, pre-encoded
+_PROCESSOR_REPO_FILES = (
+    # Various file types
+    ("main.py", b"print('Hello')"),
+    ("app.js", b"console.log('Hello');"),
+    ("README.md", b"# Test Repo"),
+    ("package.json", b'{"name": "test"}'),
+    (".gitignore", b"*.pyc"),
+    # A subdirectory with files
+    ("src/utils.py", b"def helper(): pass"),
+    # Files that should be ignored
+    ("node_modules/package.js", b"ignored"),
+)
 
-class TestFileProcessor:
-    """Test cases for FileProcessor."""
 
-    @pytest.fixture
-    def temp_repo(self):
-        """Create a temporary repository with various file types."""
-        temp_dir = Path(tempfile.mkdtemp())
+@pytest.fixture(scope="session")
+def processor_repo(tmp_path_factory):
+    """Create a temporary repository with various file types, once per session."""
+    temp_dir = tmp_path_factory.mktemp("repo")
 
-        # Create various file types
-        (temp_dir / "main.py").write_text("print('Hello')")
-        (temp_dir / "app.js").write_text("console.log('Hello');")
-        (temp_dir / "README.md").write_text("# Test Repo")
-        (temp_dir / "package.json").write_text('{"name": "test"}')
-        (temp_dir / ".gitignore").write_text("*.pyc")
+    for name, content in _PROCESSOR_REPO_FILES:
+        file_path = temp_dir / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
 
-        # Create a subdirectory with files
-        sub_dir = temp_dir / "src"
-        sub_dir.mkdir()
-        (sub_dir / "utils.py").write_text("def helper(): pass")
+    return temp_dir
 
-        # Create files that should be ignored
-        (temp_dir / "node_modules").mkdir()
-        (temp_dir / "node_modules" / "package.js").write_text("ignored")
 
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+class TestFileProcessor:
+    """Test cases for FileProcessor."""
 
-    def test_get_all_source_files(self, temp_repo):
+    def test_get_all_source_files(self, processor_repo):
         """Test getting all source files."""
         processor = FileProcessor()
-        files = processor.get_all_source_files(temp_repo)
+        files = processor.get_all_source_files(processor_repo)
 
         # Should find Python, JS, MD, and JSON files
-        file_names = [f.name for f in files]
+        file_names = [f.path.name for f in files]
         assert "main.py" in file_names
         assert "app.js" in file_names
         assert "README.md" in file_names
@@ -136,19 +145,21 @@ class TestFileProcessor:
         # Should ignore files in node_modules
         assert "package.js" not in file_names
 
-    def test_prioritize_files(self, temp_repo):
+    def test_prioritize_files(self, processor_repo):
         """Test file prioritization."""
         processor = FileProcessor()
-        all_files = processor.get_all_source_files(temp_repo)
+        all_files = processor.get_all_source_files(processor_repo)
         prioritized = processor.prioritize_files(all_files)
 
         # Priority files should come first
-        priority_names = {f.name for f in prioritized[:3]}
+        priority_names = {f.path.name for f in prioritized[:3]}
         assert "main.py" in priority_names or "package.json" in priority_names
 
-    def test_should_ignore_file(self, temp_repo):
+    def test_should_ignore_file(self):
         """Test file ignoring logic."""
         processor = FileProcessor()
+        # Pure path logic, so no repository on disk is needed
+        temp_repo = Path("repo")
 
         assert processor._should_ignore_file(temp_repo / "node_modules" / "test.js")
         assert processor._should_ignore_file(temp_repo / "test.pyc")
@@ -156,6 +167,195 @@ class TestFileProcessor:
         assert not processor._should_ignore_file(temp_repo / ".env.example")
 
 
+# FilePath: tests/test_git_handler.py
+
+import shutil
+import subprocess
+
+import pytest
+
+from repo_analyzer.core.git_handler import GitHandler
+
+requires_git = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in a test repository and return its output."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args], check=True, capture_output=True, text=True
+    )
+    return result.stdout
+
+
+@pytest.fixture(scope="module")
+def git_repo(tmp_path_factory):
+    """Create a git repository with two commits, a branch and a tag, once per module."""
+    repo = tmp_path_factory.mktemp("git_repo")
+
+    _git(repo, "init", "-q")
+    _git(repo, "symbolic-ref", "HEAD", "refs/heads/main")
+    _git(repo, "config", "user.name", "Test User")
+    _git(repo, "config", "user.email", "test@example.com")
+    (repo / "main.py").write_bytes(b"print('Hello')\n")
+    (repo / "a b.txt").write_bytes(b"spaced name\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "Initial commit")
+    (repo / "main.py").write_bytes(b"print('Hello, World!')\n")
+    _git(repo, "commit", "-q", "-am", "Update greeting")
+    _git(repo, "branch", "feature")
+    _git(repo, "tag", "v1.0")
+
+    return repo
+
+
+@pytest.fixture
+def git_handler():
+    """Create a GitHandler that is cleaned up after the test."""
+    handler = GitHandler()
+    yield handler
+    handler.cleanup()
+
+
+@requires_git
+class TestGitHandler:
+    """Test cases for GitHandler."""
+
+    def test_read_blob(self, git_handler, git_repo):
+        """Test reading file content at a revision."""
+        assert (
+            git_handler.read_blob(git_repo, "HEAD", "main.py")
+            == b"print('Hello, World!')\n"
+        )
+        assert (
+            git_handler.read_blob(git_repo, "HEAD~1", "main.py") == b"print('Hello')\n"
+        )
+        assert git_handler.read_blob(git_repo, "HEAD", "a b.txt") == b"spaced name\n"
+
+    def test_read_blob_missing(self, git_handler, git_repo):
+        """Test that missing objects, including names with spaces, give None."""
+        assert git_handler.read_blob(git_repo, "HEAD", "missing.py") is None
+        assert git_handler.read_blob(git_repo, "HEAD", "a c.txt") is None
+        assert git_handler.read_blob(git_repo, "no such rev", "main.py") is None
+
+        # The process stays usable after a miss
+        assert git_handler.read_blob(git_repo, "HEAD", "a b.txt") == b"spaced name\n"
+
+    def test_repository_lock_shared_between_handlers(self, git_handler, git_repo):
+        """Test that every handler serializes on the same lock per repository."""
+        lock = git_handler._lock_for(git_repo)
+
+        assert GitHandler()._lock_for(git_repo / ".." / git_repo.name) is lock
+        assert GitHandler()._lock_for(git_repo.parent) is not lock
+
+    @patch("repo_analyzer.core.git_handler.pygit2", None)
+    def test_extract_git_info_without_shell(self, git_repo):
+        """Test that git info is the same when no POSIX shell is available."""
+        git_info = GitHandler().extract_git_info(git_repo)
+
+        with patch("repo_analyzer.core.git_handler.shutil.which", return_value=None):
+            assert GitHandler().extract_git_info(git_repo) == git_info
+
+        assert git_info["current_branch"] == "main"
+        assert git_info["total_commits"] == 2
+        assert git_info["last_commit"]["message"] == "Update greeting"
+
+    def test_clone_repository(self, git_handler, git_repo):
+        """Test that a default clone keeps the history, branches and tags."""
+        clone = git_handler.clone_repository(git_repo.as_uri())
+        git_info = git_handler.extract_git_info(clone)
+
+        assert git_info["current_branch"] == "main"
+        assert git_info["all_branches"] == ["feature", "main"]
+        assert git_info["total_commits"] == 2
+        assert _git(clone, "tag").split() == ["v1.0"]
+
+    def test_clone_repository_shallow(self, git_handler, git_repo):
+        """Test which report fields a shallow clone still provides."""
+        clone = git_handler.clone_repository(git_repo.as_uri(), shallow=True)
+        git_info = git_handler.extract_git_info(clone)
+
+        # Still reported for the cloned commit
+        assert git_info["is_git_repo"]
+        assert git_info["error"] is None
+        assert git_info["repository_url"] == git_repo.as_uri()
+        assert git_info["current_branch"] == "main"
+        assert git_info["last_commit"]["message"] == "Update greeting"
+
+        # Lost with the rest of the history
+        assert git_info["all_branches"] == ["main"]
+        assert git_info["total_commits"] is None
+        assert _git(clone, "tag") == ""
+
+
+# FilePath: tests/test_logging_utils.py
+
+import logging
+from unittest.mock import patch
+
+from repo_analyzer.utils import logging_utils
+from repo_analyzer.utils.logging_utils import (
+    BufferedFileHandler,
+    reset_logging,
+    setup_logging,
+)
+
+
+def _log_record(level: int) -> logging.LogRecord:
+    """Build a log record at the given level."""
+    return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+
+class TestBufferedFileHandler:
+    """Test cases for BufferedFileHandler."""
+
+    def test_sync_fsyncs_flushed_records(self, tmp_path):
+        """Test that sync=True fsyncs exactly the immediately flushed records."""
+        handler = BufferedFileHandler(tmp_path / "sync.log", sync=True)
+        try:
+            with patch("repo_analyzer.utils.logging_utils.os.fsync") as mock_fsync:
+                handler.emit(_log_record(logging.INFO))
+                mock_fsync.assert_not_called()
+
+                handler.emit(_log_record(logging.WARNING))
+                mock_fsync.assert_called_once_with(handler.stream.fileno())
+        finally:
+            handler.close()
+
+        assert (tmp_path / "sync.log").read_text().count("message") == 2
+
+    def test_no_sync_by_default(self, tmp_path):
+        """Test that records are never fsynced unless sync is requested."""
+        handler = BufferedFileHandler(tmp_path / "plain.log")
+        try:
+            with patch("repo_analyzer.utils.logging_utils.os.fsync") as mock_fsync:
+                handler.emit(_log_record(logging.ERROR))
+                mock_fsync.assert_not_called()
+        finally:
+            handler.close()
+
+    def test_setup_logging_syncs_at_debug_level(self, tmp_path):
+        """Test that setup_logging syncs at DEBUG level unless told otherwise."""
+        cases = [
+            ("DEBUG", None, True),
+            ("INFO", None, False),
+            ("DEBUG", False, False),
+            ("INFO", True, True),
+        ]
+        try:
+            for log_level, sync, expected in cases:
+                setup_logging(log_level, tmp_path / "app.log", sync=sync)
+                file_handlers = [
+                    handler
+                    for handler in logging_utils._listener.handlers
+                    if isinstance(handler, BufferedFileHandler)
+                ]
+                assert [handler.sync for handler in file_handlers] == [expected]
+        finally:
+            reset_logging()
+
+
 # FilePath: tests/conftest.py
 
 import pytest